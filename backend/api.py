@@ -1,8 +1,22 @@
+import os
+import time
+from typing import Optional
+
 import numpy as np
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, PlainTextResponse
 
-from models import PredictionRequest, PredictionResponse, HealthResponse
+from models import (PredictionRequest, PredictionResponse, HealthResponse, ReadinessResponse,
+                    SweepRequest, PartialDependenceRequest, SweepResponse, BatchJobResponse,
+                    CompareRequest, CompareResponse, ProfilingRequest)
 from ml_service import ml_service
+from features import feature_encoder
+from readiness import readiness
+import sweep
+from batch_jobs import batch_jobs
+from compare import model_comparer
+from profiling import profiler, profiled, is_admin, SORT_KEYS
 from config import settings
 
 router = APIRouter()
@@ -18,9 +32,27 @@ async def root():
     }
 
 @router.get("/health", response_model=HealthResponse)
-async def health_check():
-    """Health check endpoint"""
-    return HealthResponse(status="healthy", models=1)
+async def health_check(response: Response):
+    """Health check endpoint (503 until models are loaded and warmed up)"""
+    status = "healthy" if readiness.ready else "unavailable"
+    if not readiness.ready:
+        response.status_code = 503
+    return HealthResponse(status=status, models=ml_service.get_model_count())
+
+
+@router.get("/health/live")
+async def liveness_check():
+    """Liveness probe - the process is up and serving requests"""
+    return {"status": "alive"}
+
+
+@router.get("/health/ready", response_model=ReadinessResponse)
+async def readiness_check(response: Response):
+    """Readiness probe - models are loaded and warmed up"""
+    state = readiness.status(ml_service)
+    if not state["ready"]:
+        response.status_code = 503
+    return state
 
 
 @router.get("/model-performance")
@@ -29,20 +61,18 @@ async def get_model_performance():
     return settings.MODEL_PERFORMANCE
 
 
+@router.get("/stats/coalescing")
+async def get_coalescing_stats():
+    """Get counters for coalesced in-flight predictions"""
+    return ml_service.get_coalescing_stats()
+
+
 @router.post("/predict/XGBoost", response_model=PredictionResponse)
-async def predict_churn(request: PredictionRequest):
-    """Make churn prediction using XGBoost"""
+@profiled
+def predict_churn(request: PredictionRequest):
+    """Make churn prediction using XGBoost (runs in the worker threadpool)"""
     try:
-        features = np.array([[
-            request.price,
-            request.freight_value,
-            request.payment_installments,
-            request.delivery_diff_than_estimated,
-            request.reviewed_days,
-            request.customer_state_enc,
-            request.product_category_name_enc,
-            request.payment_type_enc
-        ]])
+        features = feature_encoder.encode(request)
 
         probability, prediction, confidence = ml_service.predict(
             "XGBoost", features)
@@ -57,6 +87,143 @@ async def predict_churn(request: PredictionRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail="Prediction failed")
 
+@router.post("/sweep/XGBoost", response_model=SweepResponse)
+@profiled
+def sweep_churn(request: SweepRequest):
+    """Churn probability as one or two features vary around a base customer"""
+    try:
+        axes = sweep.build_axes(request.axes, ml_service.feature_ranges)
+        base = feature_encoder.encode(request.base)
+        surface, rows_scored = sweep.score_grid(ml_service, "XGBoost", base, axes)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception:
+        raise HTTPException(status_code=500, detail="Sweep failed")
+
+    return sweep.sweep_response("XGBoost", request.axes, axes, surface, rows_scored)
+
+
+@router.post("/partial-dependence/XGBoost", response_model=SweepResponse)
+@profiled
+def partial_dependence(request: PartialDependenceRequest):
+    """Average churn probability over a sample of x_test.csv as features vary"""
+    if not ml_service.reference.is_loaded:
+        raise HTTPException(status_code=503, detail="Reference data not loaded")
+
+    try:
+        axes = sweep.build_axes(request.axes, ml_service.feature_ranges)
+        sample = ml_service.reference.sample(
+            request.sample_size or settings.PDP_DEFAULT_SAMPLE, seed=request.seed)
+        surface, rows_scored = sweep.score_grid(ml_service, "XGBoost", sample, axes)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception:
+        raise HTTPException(status_code=500, detail="Partial dependence failed")
+
+    return sweep.sweep_response("XGBoost", request.axes, axes, surface, rows_scored)
+
+
+@router.post("/compare", response_model=CompareResponse)
+def compare_models(request: CompareRequest):
+    """Score the same customers with every loaded model in parallel"""
+    start = time.perf_counter()
+    features = feature_encoder.encode_many(request.records)
+
+    try:
+        results = model_comparer.score(ml_service, features, request.models)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    response = {
+        "rows": len(request.records),
+        "models": [
+            {"model_name": name, "error": result["error"]} if "error" in result else {
+                "model_name": name,
+                "churn_probability": np.round(result["probabilities"].astype(float), 4).tolist(),
+                "latency_ms": round(result["latency_ms"], 3)
+            }
+            for name, result in results.items()
+        ]
+    }
+
+    if request.ensemble:
+        weights = request.weights or model_comparer.default_weights(list(results))
+        combined = model_comparer.ensemble(results, weights)
+        if combined is not None:
+            response["ensemble_probability"] = np.round(combined["probabilities"], 4).tolist()
+            response["ensemble_weights"] = {
+                name: round(weight, 4) for name, weight in combined["weights"].items()}
+
+    response["total_latency_ms"] = round((time.perf_counter() - start) * 1000, 3)
+    return response
+
+
+def _get_batch_job(job_id: str):
+    job = batch_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+@router.post("/batch/jobs", response_model=BatchJobResponse)
+async def create_batch_job(total_rows: Optional[int] = Query(None, ge=0)):
+    """Start a bulk scoring job; CSV chunks are then posted to it"""
+    return batch_jobs.create(total_rows).summary()
+
+
+async def _read_body(request: Request, limit: int) -> bytes:
+    """Read the request body, failing with 413 as soon as it exceeds `limit` bytes"""
+    too_large = HTTPException(
+        status_code=413, detail=f"Chunk larger than {limit} bytes")
+
+    declared = request.headers.get("content-length")
+    if declared is not None and declared.isdigit() and int(declared) > limit:
+        raise too_large
+
+    body = bytearray()
+    async for part in request.stream():
+        body += part
+        if len(body) > limit:
+            raise too_large
+    return bytes(body)
+
+
+@router.post("/batch/jobs/{job_id}/chunks", response_model=BatchJobResponse)
+async def add_batch_chunk(job_id: str, request: Request, seq: int = Query(..., ge=0)):
+    """Score CSV chunk number `seq` (text/csv body with header row) with XGBoost and append the results"""
+    job = _get_batch_job(job_id)
+    chunk = await _read_body(request, settings.BATCH_MAX_CHUNK_BYTES)
+    try:
+        return await run_in_threadpool(
+            batch_jobs.add_chunk, job, ml_service, "XGBoost", seq, chunk)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception:
+        raise HTTPException(status_code=500, detail="Batch scoring failed")
+
+
+@router.post("/batch/jobs/{job_id}/complete", response_model=BatchJobResponse)
+async def complete_batch_job(job_id: str):
+    """Mark a job as finished"""
+    return batch_jobs.complete(_get_batch_job(job_id))
+
+
+@router.get("/batch/jobs/{job_id}", response_model=BatchJobResponse)
+async def get_batch_job(job_id: str):
+    """Progress and score distribution of a job"""
+    return _get_batch_job(job_id).summary()
+
+
+@router.get("/batch/jobs/{job_id}/results")
+async def get_batch_results(job_id: str):
+    """Download scored rows as CSV"""
+    job = _get_batch_job(job_id)
+    if not os.path.exists(job.results_path):
+        raise HTTPException(status_code=404, detail="No results yet")
+    return FileResponse(job.results_path, media_type="text/csv",
+                        filename=f"churn_scores_{job_id}.csv")
+
+
 @router.get("/feature-importance/XGBoost")
 async def get_feature_importance():
     """Get feature importance for XGBoost"""
@@ -69,3 +236,60 @@ async def get_feature_importance():
         "model_name": "XGBoost",
         **result
     }
+
+
+def require_admin(x_admin_token: Optional[str] = Header(None)):
+    if not is_admin(x_admin_token):
+        raise HTTPException(status_code=403, detail="Admin token required")
+
+
+# Only included by main.py when PROFILING_ENABLED is set
+admin_router = APIRouter(prefix="/admin/profiling", dependencies=[Depends(require_admin)])
+
+
+@admin_router.get("")
+async def profiling_status():
+    """Current profiling state"""
+    return profiler.status()
+
+
+@admin_router.post("/start")
+async def start_profiling(request: ProfilingRequest):
+    """Profile a share of requests, optionally for a fixed time window"""
+    return profiler.start(request.sample_rate, request.duration_seconds)
+
+
+@admin_router.post("/stop")
+async def stop_profiling():
+    """Stop sampling; aggregated stats are kept"""
+    return profiler.stop()
+
+
+@admin_router.delete("")
+async def reset_profiling():
+    """Discard aggregated stats"""
+    return profiler.reset()
+
+
+@admin_router.get("/stats")
+async def get_profiling_stats(format: str = "text", sort: str = "cumulative",
+                              limit: int = Query(50, ge=1)):
+    """Aggregated profile as text or a .pstats file (snakeviz/flameprof compatible)"""
+    if sort not in SORT_KEYS:
+        raise HTTPException(
+            status_code=400, detail=f"sort must be one of {', '.join(sorted(SORT_KEYS))}")
+
+    if format == "pstats":
+        data = profiler.dump_pstats()
+    elif format == "text":
+        data = profiler.dump_text(sort, limit)
+    else:
+        raise HTTPException(status_code=400, detail="format must be text or pstats")
+
+    if data is None:
+        raise HTTPException(status_code=404, detail="No profiles captured yet")
+
+    if format == "pstats":
+        return Response(data, media_type="application/octet-stream", headers={
+            "Content-Disposition": 'attachment; filename="churn_api.pstats"'})
+    return PlainTextResponse(data)
@@ -0,0 +1,173 @@
+"""
+Chunked bulk scoring jobs with results spooled to disk
+"""
+import io
+import os
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+import numpy as np
+from typing import Dict, Optional
+from config import settings
+from features import feature_encoder
+
+
+class BatchJob:
+    """State of one bulk scoring job"""
+
+    def __init__(self, job_id: str, directory: str, total_rows: Optional[int]):
+        self.job_id = job_id
+        self.results_path = os.path.join(directory, f"{job_id}.csv")
+        self.total_rows = total_rows
+        self.rows_processed = 0
+        self.next_seq = 0
+        self.rows_invalid = 0
+        self.predicted_churn = 0
+        self.probability_sum = 0.0
+        self.histogram = np.zeros(settings.BATCH_HISTOGRAM_BINS, dtype=np.int64)
+        self.status = "running"
+        self.created_at = time.time()
+        self.updated_at = self.created_at
+        self.lock = threading.Lock()
+
+    def summary(self) -> Dict:
+        """JSON-friendly progress and score distribution"""
+        scored = self.rows_processed - self.rows_invalid
+        edges = np.linspace(0, 1, settings.BATCH_HISTOGRAM_BINS + 1)
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            "total_rows": self.total_rows,
+            "rows_processed": self.rows_processed,
+            "rows_invalid": self.rows_invalid,
+            "predicted_churn": self.predicted_churn,
+            "mean_probability": round(self.probability_sum / scored, 4) if scored else None,
+            "histogram": {
+                "bin_edges": np.round(edges, 4).tolist(),
+                "counts": self.histogram.tolist()
+            }
+        }
+
+
+class BatchJobStore:
+    """Creates jobs, scores uploaded CSV chunks and appends results to disk.
+
+    Job state lives in this process, so every call for a job must reach the
+    worker that created it: run the API with a single uvicorn worker, or use
+    sticky routing per job when scaling out.
+    """
+
+    def __init__(self):
+        self.jobs: Dict[str, BatchJob] = {}
+        self._lock = threading.Lock()
+        self._directory: Optional[str] = None
+
+    @property
+    def directory(self) -> str:
+        if self._directory is None:
+            self._directory = settings.BATCH_JOB_DIR or tempfile.mkdtemp(prefix="churn-batch-")
+            os.makedirs(self._directory, exist_ok=True)
+        return self._directory
+
+    def purge_expired(self) -> int:
+        """Drop jobs idle for longer than BATCH_JOB_TTL and delete their results"""
+        cutoff = time.time() - settings.BATCH_JOB_TTL
+        with self._lock:
+            expired = [job_id for job_id, job in self.jobs.items()
+                       if job.updated_at < cutoff]
+            jobs = [self.jobs.pop(job_id) for job_id in expired]
+
+        for job in jobs:
+            with job.lock:
+                job.status = "expired"
+                if os.path.exists(job.results_path):
+                    os.remove(job.results_path)
+        return len(jobs)
+
+    def create(self, total_rows: Optional[int] = None) -> BatchJob:
+        """Start a new job"""
+        self.purge_expired()
+        job = BatchJob(uuid.uuid4().hex, self.directory, total_rows)
+        with self._lock:
+            self.jobs[job.job_id] = job
+        return job
+
+    def get(self, job_id: str) -> Optional[BatchJob]:
+        return self.jobs.get(job_id)
+
+    def add_chunk(self, job: BatchJob, ml_service, model_name: str,
+                  seq: int, chunk: bytes) -> Dict:
+        """Score CSV chunk number `seq` (with header) and append it to the job results.
+
+        A chunk that was already applied (e.g. re-sent after a timeout) is
+        ignored, so results are never appended twice.
+        """
+        import pandas as pd
+
+        with job.lock:
+            if seq < job.next_seq:
+                return job.summary()
+            if seq > job.next_seq:
+                raise ValueError(f"Expected chunk {job.next_seq}, got {seq}")
+
+        # Parse at most one row past the limit, so oversized chunks fail fast
+        data = pd.read_csv(io.BytesIO(chunk), nrows=settings.BATCH_MAX_CHUNK_ROWS + 1)
+        if len(data) > settings.BATCH_MAX_CHUNK_ROWS:
+            raise ValueError(
+                f"Chunk has more than {settings.BATCH_MAX_CHUNK_ROWS} rows")
+
+        missing = [name for name in feature_encoder.feature_names if name not in data.columns]
+        if missing:
+            raise ValueError(f"Missing columns: {', '.join(missing)}")
+
+        matrix = data[feature_encoder.feature_names].to_numpy(
+            dtype=feature_encoder.DTYPE, na_value=np.nan)
+        invalid = feature_encoder.invalid_rows(matrix)
+
+        probabilities = np.full(len(data), np.nan)
+        if (~invalid).any():
+            probabilities[~invalid] = ml_service.predict_proba_batch(
+                model_name, matrix[~invalid])
+
+        scored = probabilities[~invalid]
+        data["churn_probability"] = np.round(probabilities, 4)
+        data["prediction"] = pd.Series(
+            probabilities >= 0.5, index=data.index, dtype="Int8").mask(invalid)
+        data["valid"] = ~invalid
+
+        with job.lock:
+            if job.status != "running":
+                raise ValueError(f"Job is {job.status}")
+            if seq != job.next_seq:
+                # A concurrent duplicate of this chunk was applied first
+                return job.summary()
+
+            write_header = not os.path.exists(job.results_path)
+            data.to_csv(job.results_path, mode="a", index=False, header=write_header)
+
+            job.next_seq += 1
+            job.rows_processed += len(data)
+            job.rows_invalid += int(invalid.sum())
+            job.predicted_churn += int((scored >= 0.5).sum())
+            job.probability_sum += float(scored.sum())
+            job.histogram += np.histogram(
+                scored, bins=settings.BATCH_HISTOGRAM_BINS, range=(0, 1))[0]
+            job.updated_at = time.time()
+            return job.summary()
+
+    def complete(self, job: BatchJob) -> Dict:
+        """Mark a job as finished so no more chunks are accepted"""
+        with job.lock:
+            job.status = "completed"
+            job.updated_at = time.time()
+            return job.summary()
+
+    def shutdown(self) -> None:
+        """Remove spooled results created in a temporary directory"""
+        if self._directory and not settings.BATCH_JOB_DIR:
+            shutil.rmtree(self._directory, ignore_errors=True)
+
+
+batch_jobs = BatchJobStore()
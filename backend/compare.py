@@ -0,0 +1,92 @@
+"""
+Parallel multi-model scoring on a shared feature matrix
+"""
+import time
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+from config import settings
+
+
+class ModelComparer:
+    """Fans one feature matrix out to several models across a thread pool"""
+
+    def __init__(self):
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=settings.COMPARE_MAX_WORKERS,
+                thread_name_prefix="compare")
+        return self._executor
+
+    @staticmethod
+    def _score_one(model, features) -> Dict:
+        start = time.perf_counter()
+        probabilities = model.predict_proba(features)[:, 1]
+        return {
+            "probabilities": probabilities,
+            "latency_ms": (time.perf_counter() - start) * 1000
+        }
+
+    def score(self, ml_service, features: np.ndarray,
+              model_names: Optional[List[str]] = None) -> Dict[str, Dict]:
+        """Score every requested (or loaded) model; the matrix is shared read-only"""
+        names = model_names or ml_service.get_model_list()
+        unknown = [name for name in names if name not in ml_service.models]
+        if unknown:
+            raise ValueError(f"Models not loaded: {', '.join(unknown)}")
+
+        # Build the named (DataFrame) view at most once and share it as well
+        named = None
+        if any(ml_service.needs_named_input(name) for name in names):
+            named = ml_service.named_frame(features)
+
+        futures = {
+            name: self.executor.submit(
+                self._score_one, ml_service.models[name],
+                named if ml_service.needs_named_input(name) else features)
+            for name in names
+        }
+
+        results = {}
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                results[name] = {"error": str(e)}
+        return results
+
+    @staticmethod
+    def default_weights(model_names: List[str]) -> Dict[str, float]:
+        """Weight each model by its test ROC-AUC"""
+        return {
+            name: settings.MODEL_PERFORMANCE.get(name, {}).get("test", {}).get("roc_auc", 1.0)
+            for name in model_names
+        }
+
+    @staticmethod
+    def ensemble(results: Dict[str, Dict], weights: Dict[str, float]) -> Optional[Dict]:
+        """Weighted mean probability over the models that scored successfully"""
+        used = {name: weights.get(name, 0.0) for name, result in results.items()
+                if "error" not in result and weights.get(name, 0.0) > 0}
+        total = sum(used.values())
+        if not used or total <= 0:
+            return None
+
+        normalized = {name: weight / total for name, weight in used.items()}
+        stacked = np.stack([results[name]["probabilities"] for name in normalized])
+        coefficients = np.fromiter(normalized.values(), dtype=np.float64)
+        return {
+            "probabilities": coefficients @ stacked,
+            "weights": normalized
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
+
+model_comparer = ModelComparer()
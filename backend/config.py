@@ -2,6 +2,7 @@
 Configuration settings for the ML API
 """
 import os
+import tempfile
 from typing import Dict, List
 
 
@@ -13,9 +14,15 @@ class Settings:
 
     # Model Configuration
     MODEL_FILES: Dict[str, str] = {
-        "XGBoost": "saved_models/xgboost_grid.pkl"
+        "XGBoost": "saved_models/xgboost_grid.pkl",
+        "Gradient Boosting": "saved_models/gradient_boosting_grid.pkl",
+        "Logistic Regression": "saved_models/logistic_regression_grid.pkl"
     }
 
+    # Models that must load and warm up before the service reports ready;
+    # the rest are only used for comparison scoring
+    REQUIRED_MODELS: List[str] = ["XGBoost"]
+
     # Feature Configuration
     FEATURE_NAMES: List[str] = [
         "price", "freight_value", "payment_installments",
@@ -23,6 +30,23 @@ class Settings:
         "customer_state_enc", "product_category_name_enc", "payment_type_enc"
     ]
 
+    # Compact storage dtypes for the reference dataset
+    FEATURE_DTYPES: Dict[str, str] = {
+        "price": "float32",
+        "freight_value": "float32",
+        "payment_installments": "int16",
+        "delivery_diff_than_estimated": "int16",
+        "reviewed_days": "int16",
+        "customer_state_enc": "float32",
+        "product_category_name_enc": "int16",
+        "payment_type_enc": "int16"
+    }
+
+    # Reference Data
+    REFERENCE_DATA_FILE = "x_test.csv"
+    REFERENCE_CACHE_DIR = os.getenv(
+        "REFERENCE_CACHE_DIR", os.path.join(tempfile.gettempdir(), "churn_reference_cache"))
+
     # Model Performance Results
     MODEL_PERFORMANCE: Dict[str, Dict] = {
         'XGBoost': {
@@ -95,6 +119,36 @@ class Settings:
     CACHE_TTL = 300
     MAX_CACHE_SIZE = 32
     SAMPLE_SIZE = 1000 
+    # Warm-up Settings
+    WARMUP_ENABLED = os.getenv("WARMUP_ENABLED", "true").lower() == "true"
+    WARMUP_BATCH_SIZES: List[int] = [
+        int(size) for size in os.getenv("WARMUP_BATCH_SIZES", "1,8,64,256").split(",")
+    ]
+    WARMUP_ROUNDS = int(os.getenv("WARMUP_ROUNDS", 3))
+
+    # What-if Sweep Settings
+    SWEEP_DEFAULT_POINTS = 25
+    SWEEP_MAX_POINTS = 100
+    SWEEP_MAX_ROWS = 200000
+    PDP_DEFAULT_SAMPLE = 200
+
+    # Bulk Scoring Settings (job state is per process - see BatchJobStore)
+    BATCH_JOB_DIR = os.getenv("BATCH_JOB_DIR")
+    BATCH_JOB_TTL = 3600
+    BATCH_PURGE_INTERVAL = 300
+    BATCH_MAX_CHUNK_ROWS = 10000
+    BATCH_MAX_CHUNK_BYTES = 8 * 1024 * 1024
+    BATCH_HISTOGRAM_BINS = 20
+
+    # Model Comparison Settings
+    COMPARE_MAX_WORKERS = 4
+    COMPARE_MAX_ROWS = 10000
+
+    # Profiling Settings (off by default; admin routes need a token)
+    PROFILING_ENABLED = os.getenv("PROFILING_ENABLED", "false").lower() == "true"
+    PROFILING_ADMIN_TOKEN = os.getenv("PROFILING_ADMIN_TOKEN", "")
+
+    COALESCE_PREDICTIONS = os.getenv("COALESCE_PREDICTIONS", "true").lower() == "true"
 
     # Environment
     ENVIRONMENT = os.getenv("ENVIRONMENT", "development")
@@ -0,0 +1,91 @@
+"""
+Float32 feature encoding with dtype-aware, vectorized validation
+"""
+import threading
+import numpy as np
+from typing import List, Sequence, Tuple
+from config import settings
+from models import PredictionRequest
+
+
+class FeatureEncoder:
+    """Owns the model input schema and turns requests into float32 matrices"""
+
+    DTYPE = np.float32
+
+    def __init__(self, feature_names: Sequence[str] = None):
+        self.feature_names: List[str] = list(
+            feature_names or settings.FEATURE_NAMES)
+        self.lower, self.upper = self._load_bounds()
+        self.integer_columns = np.array([
+            PredictionRequest.model_fields[name].annotation is int
+            for name in self.feature_names
+        ])
+        self._local = threading.local()
+
+    @property
+    def n_features(self) -> int:
+        return len(self.feature_names)
+
+    def _load_bounds(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Read ge/le bounds from the PredictionRequest field definitions"""
+        lower = np.full(len(self.feature_names), -np.inf)
+        upper = np.full(len(self.feature_names), np.inf)
+
+        for j, name in enumerate(self.feature_names):
+            field = PredictionRequest.model_fields[name]
+            for constraint in field.metadata:
+                if hasattr(constraint, "ge"):
+                    lower[j] = constraint.ge
+                elif hasattr(constraint, "le"):
+                    upper[j] = constraint.le
+
+        return lower, upper
+
+    def _buffer(self, rows: int) -> np.ndarray:
+        """Per-thread reusable buffer with at least `rows` rows"""
+        buf = getattr(self._local, "buffer", None)
+        if buf is None or buf.shape[0] < rows:
+            capacity = max(rows, 2 * buf.shape[0] if buf is not None else 1)
+            buf = np.empty((capacity, self.n_features), dtype=self.DTYPE)
+            self._local.buffer = buf
+        return buf[:rows]
+
+    def encode(self, request: PredictionRequest) -> np.ndarray:
+        """Encode one request into a (1, n_features) view of the thread buffer.
+
+        The returned array is overwritten by the next encode call on the same
+        thread, so it must be consumed (or copied) before then.
+        """
+        out = self._buffer(1)
+        row = out[0]
+        for j, name in enumerate(self.feature_names):
+            row[j] = getattr(request, name)
+        return out
+
+    def encode_many(self, records: Sequence) -> np.ndarray:
+        """Encode requests or dicts into a (n, n_features) view of the thread buffer.
+
+        As with encode, the result is overwritten by the next encode call on the
+        same thread. Handing it to other threads is only safe while this thread
+        waits for them to finish.
+        """
+        out = self._buffer(len(records))
+        for i, record in enumerate(records):
+            values = record if isinstance(record, dict) else record.__dict__
+            row = out[i]
+            for j, name in enumerate(self.feature_names):
+                row[j] = values[name]
+        return out
+
+    def invalid_rows(self, matrix: np.ndarray) -> np.ndarray:
+        """Boolean mask of rows that are non-finite, outside the schema bounds,
+        or fractional in an int field (which PredictionRequest would reject)"""
+        bad = ~np.isfinite(matrix)
+        bad[:, self.integer_columns] |= matrix[:, self.integer_columns] % 1 != 0
+        bad |= matrix < self.lower.astype(matrix.dtype)
+        bad |= matrix > self.upper.astype(matrix.dtype)
+        return bad.any(axis=1)
+
+
+feature_encoder = FeatureEncoder()
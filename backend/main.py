@@ -1,10 +1,15 @@
+import asyncio
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 
 from config import settings
 from ml_service import ml_service
-from api import router
+from api import router, admin_router
+from readiness import readiness
+from batch_jobs import batch_jobs
+from compare import model_comparer
 
 app = FastAPI(
     title=settings.API_TITLE,
@@ -25,6 +30,16 @@ app.add_middleware(
 
 app.include_router(router)
 
+if settings.PROFILING_ENABLED:
+    app.include_router(admin_router)
+
+
+async def purge_batch_jobs():
+    """Periodically remove expired batch jobs, even when no new jobs are created"""
+    while True:
+        await asyncio.sleep(settings.BATCH_PURGE_INTERVAL)
+        batch_jobs.purge_expired()
+
 
 @app.on_event("startup")
 async def startup_event():
@@ -40,6 +55,20 @@ async def startup_event():
         for name, error in failed_models:
             print(f"   - {name}: {error}")
 
-    print(f"\n🎯 Final status: {loaded_count}/1 models loaded")
+    print(f"\n🎯 Final status: {loaded_count}/{len(settings.MODEL_FILES)} models loaded")
     print(f"📋 Available models: {ml_service.get_model_list()}")
-    print(f"🚀 API ready with {loaded_count} models (Memory optimized)")
+
+    app.state.purge_task = asyncio.create_task(purge_batch_jobs())
+
+    if readiness.warm_up(ml_service):
+        print(f"🚀 API ready with {loaded_count} models (Memory optimized)")
+    else:
+        print(f"⚠️  API not ready: {readiness.reason}")
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Clean up spooled batch results and worker threads"""
+    app.state.purge_task.cancel()
+    batch_jobs.shutdown()
+    model_comparer.shutdown()
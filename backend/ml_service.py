@@ -1,11 +1,15 @@
 import os
 import gc
-import joblib
-import numpy as np
-import pandas as pd
 from functools import lru_cache
-from typing import Dict, Optional, Tuple, Any, List
+from typing import TYPE_CHECKING, Dict, Optional, Tuple, Any, List
 from config import settings
+from singleflight import SingleFlight
+
+# numpy, joblib and the reference store are imported on first use so that
+# importing this module stays cheap for short-lived workers and tooling
+if TYPE_CHECKING:
+    import numpy as np
+    from reference_store import ReferenceStore
 
 
 class MLService:
@@ -16,9 +20,24 @@ class MLService:
         self.model_metadata: Dict[str, Dict] = {}
         self.feature_ranges: Dict[str, Dict[str, float]] = {}
         self._script_dir = os.path.dirname(os.path.abspath(__file__))
+        self._reference: Optional["ReferenceStore"] = None
+        self._predict_flight = SingleFlight()
+
+    @property
+    def reference(self) -> "ReferenceStore":
+        """Memory-mapped reference dataset, created on first access"""
+        if self._reference is None:
+            from reference_store import ReferenceStore
+
+            self._reference = ReferenceStore(
+                os.path.join(self._script_dir, settings.REFERENCE_DATA_FILE),
+                os.path.join(self._script_dir, settings.REFERENCE_CACHE_DIR))
+        return self._reference
 
     def load_model(self) -> Tuple[int, List[Tuple[str, str]]]:
         """Load ML model and return success"""
+        import joblib
+
         loaded_count = 0
         failed_models: List[Tuple[str, str]] = []
 
@@ -33,7 +52,11 @@ class MLService:
 
                     self.model_metadata[name] = {
                         "type": type(model).__name__,
-                        "has_feature_importance": hasattr(model, "feature_importances_") or hasattr(model, "coef_")
+                        "has_feature_importance": hasattr(model, "feature_importances_") or hasattr(model, "coef_"),
+                        # scikit-learn estimators fitted on a DataFrame warn on every
+                        # call with a bare ndarray; XGBoost does not need names
+                        "named_input": hasattr(model, "feature_names_in_")
+                        and type(model).__module__.startswith("sklearn.")
                     }
 
                     loaded_count += 1
@@ -51,42 +74,44 @@ class MLService:
 
     def load_feature_ranges(self) -> bool:
         """Load feature ranges for validation"""
-        x_test_path = os.path.join(self._script_dir, "x_test.csv")
-
-        if os.path.exists(x_test_path):
-            try:
-                sample_data = pd.read_csv(
-                    x_test_path, index_col=0, nrows=settings.SAMPLE_SIZE)
-                stats = sample_data.describe()
-
-                self.feature_ranges = {
-                    col: {
-                        "min": float(stats.loc["min", col]),
-                        "max": float(stats.loc["max", col]),
-                        "mean": float(stats.loc["mean", col])
-                    }
-                    for col in sample_data.columns
+        import numpy as np
+
+        if not self.reference.is_loaded and not self.reference.load():
+            return False
+
+        try:
+            rows = slice(0, settings.SAMPLE_SIZE)
+            self.feature_ranges = {}
+            for col in self.reference.columns:
+                values = self.reference.column(col)[rows]
+                self.feature_ranges[col] = {
+                    "min": float(values.min()),
+                    "max": float(values.max()),
+                    "mean": float(values.mean(dtype=np.float64))
                 }
 
-                del sample_data, stats
-                gc.collect()
-                print("✅ Loaded feature ranges")
-                return True
+            print("✅ Loaded feature ranges")
+            return True
 
-            except Exception as e:
-                print(f"❌ Failed to load feature ranges: {e}")
-                return False
+        except Exception as e:
+            print(f"❌ Failed to load feature ranges: {e}")
+            return False
 
-        print("❌ x_test.csv not found")
-        return False
-
-    def predict(self, model_name: str, features: np.ndarray) -> Tuple[float, int, str]:
+    def predict(self, model_name: str, features: "np.ndarray") -> Tuple[float, int, str]:
         """Make prediction with given model"""
         if model_name not in self.models:
             raise ValueError(f"Model {model_name} not found")
 
+        if not settings.COALESCE_PREDICTIONS:
+            return self._predict(model_name, features)
+
+        key = (model_name, features.dtype.str, features.shape, features.tobytes())
+        return self._predict_flight.do(key, self._predict, model_name, features)
+
+    def _predict(self, model_name: str, features: "np.ndarray") -> Tuple[float, int, str]:
+        """Score a single row without coalescing"""
         model = self.models[model_name]
-        probability = float(model.predict_proba(features)[0, 1])
+        probability = float(model.predict_proba(self.model_input(model_name, features))[0, 1])
         prediction = int(probability >= 0.5)
 
         if probability > 0.9:
@@ -102,6 +127,29 @@ class MLService:
 
         return probability, prediction, confidence
 
+    def predict_proba_batch(self, model_name: str, features: "np.ndarray") -> "np.ndarray":
+        """Churn probabilities for every row of a feature matrix"""
+        if model_name not in self.models:
+            raise ValueError(f"Model {model_name} not found")
+
+        return self.models[model_name].predict_proba(
+            self.model_input(model_name, features))[:, 1]
+
+    def needs_named_input(self, model_name: str) -> bool:
+        """Whether the model expects a DataFrame with feature names"""
+        return self.model_metadata.get(model_name, {}).get("named_input", False)
+
+    def model_input(self, model_name: str, features: "np.ndarray"):
+        """The feature matrix, wrapped with column names for models fitted on a DataFrame"""
+        return self.named_frame(features) if self.needs_named_input(model_name) else features
+
+    @staticmethod
+    def named_frame(features: "np.ndarray"):
+        """Zero-copy DataFrame view of a feature matrix with settings.FEATURE_NAMES"""
+        import pandas as pd
+
+        return pd.DataFrame(features, columns=settings.FEATURE_NAMES, copy=False)
+
     @lru_cache(maxsize=settings.MAX_CACHE_SIZE)
     def get_feature_importance(self, model_name: str) -> Optional[Dict]:
         """Get cached feature importance"""
@@ -116,7 +164,7 @@ class MLService:
         if hasattr(model, 'feature_importances_'):
             importance = model.feature_importances_
         elif hasattr(model, 'coef_'):
-            importance = np.abs(model.coef_[0])
+            importance = abs(model.coef_[0])
         else:
             return None
 
@@ -130,6 +178,14 @@ class MLService:
             "top_features": sorted_features[:5]
         }
 
+    def get_coalescing_stats(self) -> Dict[str, int]:
+        """Get single-flight counters for predictions"""
+        return self._predict_flight.stats()
+
+    def reset_coalescing_stats(self) -> None:
+        """Reset single-flight counters, e.g. after warm-up"""
+        self._predict_flight.reset_stats()
+
     def get_model_list(self) -> list:
         """Get list of available models"""
         return list(self.models.keys())
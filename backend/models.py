@@ -1,5 +1,6 @@
 from pydantic import BaseModel, Field
 from typing import Dict, List, Optional
+from config import settings
 
 class PredictionRequest(BaseModel):
     """Request model for churn prediction"""
@@ -19,11 +20,86 @@ class PredictionResponse(BaseModel):
     prediction: int = Field(..., ge=0, le=1)
     confidence: str
 
+class SweepAxis(BaseModel):
+    """One feature to vary, with explicit values or a min/max/points grid"""
+    feature: str
+    values: Optional[List[float]] = Field(None, min_length=1, max_length=settings.SWEEP_MAX_POINTS,
+                                          description="Explicit grid values")
+    min: Optional[float] = Field(None, description="Grid start (defaults to reference data min)")
+    max: Optional[float] = Field(None, description="Grid end (defaults to reference data max)")
+    points: Optional[int] = Field(None, ge=2, le=settings.SWEEP_MAX_POINTS, description="Number of grid points")
+
+class SweepRequest(BaseModel):
+    """What-if sweep around one customer"""
+    base: PredictionRequest
+    axes: List[SweepAxis] = Field(..., min_length=1, max_length=2)
+
+class PartialDependenceRequest(BaseModel):
+    """Population-level partial dependence over a sample of x_test.csv"""
+    axes: List[SweepAxis] = Field(..., min_length=1, max_length=2)
+    sample_size: Optional[int] = Field(None, ge=1, description="Rows sampled from x_test.csv")
+    seed: int = 0
+
+class SweepResponse(BaseModel):
+    """Churn probability curve (1 axis) or surface (2 axes, first axis major)"""
+    model_name: str
+    features: List[str]
+    grid: List[List[float]]
+    churn_probability: List
+    rows_scored: int
+
+class BatchJobResponse(BaseModel):
+    """Progress and score distribution of a bulk scoring job"""
+    job_id: str
+    status: str
+    total_rows: Optional[int]
+    rows_processed: int
+    rows_invalid: int
+    predicted_churn: int
+    mean_probability: Optional[float]
+    histogram: Dict[str, list]
+
+class CompareRequest(BaseModel):
+    """Score customers against several models at once"""
+    records: List[PredictionRequest] = Field(..., min_length=1, max_length=settings.COMPARE_MAX_ROWS)
+    models: Optional[List[str]] = Field(None, description="Defaults to every loaded model")
+    ensemble: bool = False
+    weights: Optional[Dict[str, float]] = Field(None, description="Defaults to test ROC-AUC per model")
+
+class ModelScore(BaseModel):
+    """One model's scores and serving cost"""
+    model_name: str
+    churn_probability: Optional[List[float]] = None
+    latency_ms: Optional[float] = None
+    error: Optional[str] = None
+
+class CompareResponse(BaseModel):
+    """Per-model scores, optional ensemble and total latency"""
+    rows: int
+    models: List[ModelScore]
+    ensemble_probability: Optional[List[float]] = None
+    ensemble_weights: Optional[Dict[str, float]] = None
+    total_latency_ms: float
+
+class ProfilingRequest(BaseModel):
+    """Start statistical profiling of prediction requests"""
+    sample_rate: float = Field(1.0, gt=0, le=1, description="Share of requests to profile")
+    duration_seconds: Optional[float] = Field(None, gt=0, description="Stop after this window")
+
 class HealthResponse(BaseModel):
     """Health check response"""
     status: str
     models: int
 
+class ReadinessResponse(BaseModel):
+    """Readiness check response"""
+    ready: bool
+    reason: str
+    models: int
+    uptime_seconds: float
+    warmup_latencies: Dict[str, Dict[int, Dict[str, float]]]
+    warmup_errors: Dict[str, str]
+
 class ModelsResponse(BaseModel):
     """Available models response"""
     available_models: List[str]
@@ -0,0 +1,169 @@
+"""
+Opt-in cProfile hooks for the prediction hot path.
+
+Only active when PROFILING_ENABLED is set: otherwise `profiled` returns the
+endpoint unchanged and the admin routes are not installed, so there is no
+overhead at all. When enabled, only the decorated scoring routes pay for a
+sampling check and two optional header lookups.
+"""
+import cProfile
+import hmac
+import inspect
+import io
+import marshal
+import pstats
+import random
+import threading
+import time
+from functools import wraps
+from typing import Callable, Dict, Optional
+from fastapi import Header
+from config import settings
+
+# On Python 3.12+ cProfile uses the process-wide sys.monitoring, so only one
+# profile may be enabled at a time; other sampled requests run unprofiled
+_profile_slot = threading.Lock()
+
+SORT_KEYS = frozenset({key.value for key in pstats.SortKey} | {"tottime"})
+
+
+class Profiler:
+    """Captures cProfile stats for a share of requests and aggregates them in memory"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.active = False
+        self.sample_rate = 0.0
+        self.until: Optional[float] = None
+        self.started_at: Optional[float] = None
+        self.profiled_requests = 0
+        self._stats: Optional[pstats.Stats] = None
+
+    def start(self, sample_rate: float, duration_seconds: Optional[float] = None) -> Dict:
+        """Profile `sample_rate` of requests, optionally for a fixed window"""
+        with self._lock:
+            self.active = True
+            self.sample_rate = sample_rate
+            self.started_at = time.time()
+            self.until = self.started_at + duration_seconds if duration_seconds else None
+        return self.status()
+
+    def stop(self) -> Dict:
+        with self._lock:
+            self.active = False
+            self.until = None
+        return self.status()
+
+    def reset(self) -> Dict:
+        """Drop aggregated stats"""
+        with self._lock:
+            self._stats = None
+            self.profiled_requests = 0
+        return self.status()
+
+    def should_profile(self, forced: bool = False) -> bool:
+        if forced:
+            return True
+        if not self.active:
+            return False
+
+        with self._lock:
+            if not self.active:
+                return False
+            if self.until is not None and time.time() > self.until:
+                self.active = False
+                return False
+            sample_rate = self.sample_rate
+        return random.random() < sample_rate
+
+    def record(self, profile: cProfile.Profile) -> None:
+        """Merge one request's profile into the aggregate"""
+        with self._lock:
+            if self._stats is None:
+                self._stats = pstats.Stats(profile)
+            else:
+                self._stats.add(profile)
+            self.profiled_requests += 1
+
+    def status(self) -> Dict:
+        return {
+            "active": self.active,
+            "sample_rate": self.sample_rate,
+            "until": self.until,
+            "started_at": self.started_at,
+            "profiled_requests": self.profiled_requests
+        }
+
+    def dump_pstats(self) -> Optional[bytes]:
+        """Aggregate in the binary format read by pstats, snakeviz and flameprof"""
+        with self._lock:
+            if self._stats is None:
+                return None
+            return marshal.dumps(self._stats.stats)
+
+    def dump_text(self, sort_by: str = "cumulative", limit: int = 50) -> Optional[str]:
+        """Human-readable top functions"""
+        with self._lock:
+            if self._stats is None:
+                return None
+            out = io.StringIO()
+            self._stats.stream = out
+            self._stats.sort_stats(sort_by).print_stats(limit)
+            return out.getvalue()
+
+
+profiler = Profiler()
+
+
+def is_admin(token: Optional[str]) -> bool:
+    return bool(settings.PROFILING_ADMIN_TOKEN) and token is not None and \
+        hmac.compare_digest(token.encode(), settings.PROFILING_ADMIN_TOKEN.encode())
+
+
+# Extra header parameters injected into profiled endpoints; `X-Profile: 1`
+# plus a valid admin token profiles that single request
+_HEADER_PARAMS = [
+    inspect.Parameter("x_profile_header", inspect.Parameter.KEYWORD_ONLY,
+                      default=Header(None, alias="X-Profile", include_in_schema=False)),
+    inspect.Parameter("x_profile_admin_token", inspect.Parameter.KEYWORD_ONLY,
+                      default=Header(None, alias="X-Admin-Token", include_in_schema=False)),
+]
+
+
+def profiled(func: Callable) -> Callable:
+    """Profile a sync endpoint in its worker thread when sampling selects it.
+
+    Only one request is profiled at a time; concurrent selected requests run
+    unprofiled rather than failing. cProfile traces the calling thread, so
+    only decorate endpoints that do their work in that thread.
+    """
+    if not settings.PROFILING_ENABLED:
+        return func
+
+    @wraps(func)
+    def wrapper(*args, x_profile_header: Optional[str] = None,
+                x_profile_admin_token: Optional[str] = None, **kwargs):
+        forced = x_profile_header == "1" and is_admin(x_profile_admin_token)
+        if not profiler.should_profile(forced) or not _profile_slot.acquire(blocking=False):
+            return func(*args, **kwargs)
+
+        try:
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+            except ValueError:
+                # Another profiling tool (e.g. a debugger) owns sys.monitoring
+                return func(*args, **kwargs)
+
+            try:
+                return func(*args, **kwargs)
+            finally:
+                profile.disable()
+                profiler.record(profile)
+        finally:
+            _profile_slot.release()
+
+    signature = inspect.signature(func)
+    wrapper.__signature__ = signature.replace(
+        parameters=list(signature.parameters.values()) + _HEADER_PARAMS)
+    return wrapper
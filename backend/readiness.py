@@ -0,0 +1,119 @@
+"""
+Liveness/readiness state and model warm-up
+"""
+import time
+import numpy as np
+from typing import Dict, List
+from config import settings
+from features import feature_encoder
+from models import PredictionRequest
+
+
+class ReadinessService:
+    """Tracks whether models are loaded and warmed before taking traffic"""
+
+    def __init__(self):
+        self.started_at = time.time()
+        self.ready = False
+        self.reason = "starting"
+        self.warmup_latencies: Dict[str, Dict[int, Dict[str, float]]] = {}
+        self.warmup_errors: Dict[str, str] = {}
+
+    def _warmup_batch(self, ml_service, size: int) -> np.ndarray:
+        """Representative rows from x_test.csv, or feature means as fallback"""
+        if ml_service.reference.is_loaded and len(ml_service.reference):
+            batch = ml_service.reference.sample(size, seed=size)
+            if len(batch) == size:
+                return batch
+            reps = -(-size // len(batch))
+            return np.tile(batch, (reps, 1))[:size]
+
+        means = [ml_service.feature_ranges.get(name, {}).get("mean", 0.0)
+                 for name in settings.FEATURE_NAMES]
+        return np.tile(np.asarray(means, dtype=np.float32), (size, 1))
+
+    @staticmethod
+    def _warmup_request(batch: np.ndarray) -> PredictionRequest:
+        """First in-schema row of a batch as a request, for the single-row serving path"""
+        valid = np.flatnonzero(~feature_encoder.invalid_rows(batch))
+        row = batch[valid[0]] if len(valid) else \
+            np.clip(batch[0], feature_encoder.lower, feature_encoder.upper)
+
+        values = {}
+        for name, value in zip(feature_encoder.feature_names, row):
+            annotation = PredictionRequest.model_fields[name].annotation
+            values[name] = annotation(round(value) if annotation is int else value)
+        return PredictionRequest(**values)
+
+    def warm_up(self, ml_service) -> bool:
+        """Run each batch-size bucket through each model and mark readiness"""
+        self.ready = False
+        self.warmup_latencies = {}
+        self.warmup_errors = {}
+
+        missing = [name for name in settings.REQUIRED_MODELS
+                   if name not in ml_service.models]
+        if missing:
+            self.reason = f"models not loaded: {', '.join(missing)}"
+            print(f"❌ Not ready - {self.reason}")
+            return False
+
+        if not settings.WARMUP_ENABLED:
+            self.ready = True
+            self.reason = "ready (warm-up disabled)"
+            return True
+
+        batches = {size: self._warmup_batch(ml_service, size)
+                   for size in settings.WARMUP_BATCH_SIZES}
+
+        request = self._warmup_request(batches[max(batches)])
+
+        for name in ml_service.get_model_list():
+            self.warmup_latencies[name] = {}
+            try:
+                for size, batch in batches.items():
+                    timings: List[float] = []
+                    for _ in range(settings.WARMUP_ROUNDS):
+                        start = time.perf_counter()
+                        if size == 1:
+                            # Same path as /predict: encoder buffer + MLService.predict
+                            ml_service.predict(name, feature_encoder.encode(request))
+                        else:
+                            ml_service.predict_proba_batch(name, batch)
+                        timings.append((time.perf_counter() - start) * 1000)
+
+                    self.warmup_latencies[name][size] = {
+                        "first_ms": round(timings[0], 3),
+                        "median_ms": round(float(np.median(timings)), 3)
+                    }
+                print(f"🔥 Warmed up {name}: {self.warmup_latencies[name]}")
+            except Exception as e:
+                self.warmup_errors[name] = str(e)
+                print(f"❌ Warm-up failed for {name}: {e}")
+
+        # Warm-up predictions should not count as served traffic
+        ml_service.reset_coalescing_stats()
+
+        failed_required = [name for name in settings.REQUIRED_MODELS
+                           if name in self.warmup_errors]
+        if failed_required:
+            self.reason = f"warm-up failed: {', '.join(failed_required)}"
+            return False
+
+        self.ready = True
+        self.reason = "ready"
+        return True
+
+    def status(self, ml_service) -> Dict:
+        """Readiness payload"""
+        return {
+            "ready": self.ready,
+            "reason": self.reason,
+            "models": ml_service.get_model_count(),
+            "uptime_seconds": round(time.time() - self.started_at, 1),
+            "warmup_latencies": self.warmup_latencies,
+            "warmup_errors": self.warmup_errors
+        }
+
+
+readiness = ReadinessService()
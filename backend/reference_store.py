@@ -0,0 +1,180 @@
+"""
+Memory-mapped columnar store for the reference dataset (x_test.csv)
+"""
+import os
+import json
+import tempfile
+import numpy as np
+from typing import Dict, List, Optional, Sequence, Tuple
+from config import settings
+
+
+class ReferenceStore:
+    """Typed, memory-mapped column store built once from the reference CSV"""
+
+    INDEX_COLUMN = "__index__"
+    META_FILE = "meta.json"
+
+    def __init__(self, csv_path: str, cache_dir: str):
+        self.csv_path = csv_path
+        self.cache_dir = cache_dir
+        self._columns: Dict[str, np.ndarray] = {}
+        self._index: Optional[np.ndarray] = None
+
+    @property
+    def is_loaded(self) -> bool:
+        return bool(self._columns)
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self._columns.keys())
+
+    def __len__(self) -> int:
+        return 0 if self._index is None else len(self._index)
+
+    def _source_signature(self) -> Dict[str, float]:
+        stat = os.stat(self.csv_path)
+        return {"size": stat.st_size, "mtime": stat.st_mtime}
+
+    def _column_path(self, name: str) -> str:
+        return os.path.join(self.cache_dir, f"{name}.npy")
+
+    def _is_stale(self) -> bool:
+        meta_path = os.path.join(self.cache_dir, self.META_FILE)
+        if not os.path.exists(meta_path):
+            return True
+
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return True
+
+        if meta.get("source") != self._source_signature():
+            return True
+        if meta.get("dtypes") != settings.FEATURE_DTYPES:
+            return True
+
+        names = [self.INDEX_COLUMN] + list(meta.get("columns", []))
+        return not all(os.path.exists(self._column_path(n)) for n in names)
+
+    @staticmethod
+    def _cast(name: str, values: np.ndarray) -> np.ndarray:
+        """Cast a column to its configured dtype, widening if that would lose data"""
+        dtype = np.dtype(settings.FEATURE_DTYPES.get(name, "float32"))
+        if np.issubdtype(dtype, np.integer):
+            info = np.iinfo(dtype)
+            if (np.any(values % 1 != 0) or values.min() < info.min
+                    or values.max() > info.max):
+                print(f"⚠️  {name} does not fit {dtype}, storing as float32")
+                dtype = np.dtype("float32")
+        return values.astype(dtype)
+
+    def _atomic_write(self, path: str, write) -> None:
+        """Write via a per-process temp file and rename, so concurrent workers never see partial files"""
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                write(f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _parse(self) -> Tuple[Dict[str, np.ndarray], List[str]]:
+        """Parse the CSV into typed arrays keyed by column, plus the feature column order"""
+        import pandas as pd
+
+        data = pd.read_csv(self.csv_path, index_col=0)
+        arrays = {self.INDEX_COLUMN: data.index.to_numpy(dtype=np.int64)}
+        for col in data.columns:
+            arrays[col] = self._cast(col, data[col].to_numpy(dtype=np.float64))
+        return arrays, list(data.columns)
+
+    def build(self) -> None:
+        """Parse the CSV once and write one .npy file per column"""
+        arrays, columns = self._parse()
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        for name, values in arrays.items():
+            self._atomic_write(self._column_path(name), lambda f, v=values: np.save(f, v))
+
+        meta = {
+            "source": self._source_signature(),
+            "dtypes": settings.FEATURE_DTYPES,
+            "columns": columns,
+            "rows": len(arrays[self.INDEX_COLUMN])
+        }
+        self._atomic_write(
+            os.path.join(self.cache_dir, self.META_FILE),
+            lambda f: f.write(json.dumps(meta).encode()))
+
+        del arrays
+        print(f"✅ Built reference store in {self.cache_dir}")
+
+    def _load_in_memory(self) -> None:
+        """Keep the typed arrays in process memory when the cache dir is not writable"""
+        arrays, columns = self._parse()
+        self._index = arrays.pop(self.INDEX_COLUMN)
+        for values in arrays.values():
+            values.flags.writeable = False
+        self._columns = {col: arrays[col] for col in columns}
+
+    def load(self) -> bool:
+        """Memory-map the column files, rebuilding them if the CSV changed"""
+        if not os.path.exists(self.csv_path):
+            print(f"❌ Reference data not found: {self.csv_path}")
+            return False
+
+        try:
+            if self._is_stale():
+                try:
+                    self.build()
+                except OSError as e:
+                    print(f"⚠️  Cannot write reference cache ({e}), keeping it in memory")
+                    self._load_in_memory()
+                    return True
+
+            with open(os.path.join(self.cache_dir, self.META_FILE)) as f:
+                meta = json.load(f)
+
+            self._index = np.load(
+                self._column_path(self.INDEX_COLUMN), mmap_mode="r")
+            self._columns = {
+                col: np.load(self._column_path(col), mmap_mode="r")
+                for col in meta["columns"]
+            }
+            return True
+
+        except Exception as e:
+            print(f"❌ Failed to load reference store: {e}")
+            self._columns = {}
+            self._index = None
+            return False
+
+    def column(self, name: str) -> np.ndarray:
+        """Zero-copy, read-only view of a single column"""
+        if name not in self._columns:
+            raise KeyError(f"Column {name} not in reference store")
+        return self._columns[name]
+
+    def matrix(self, rows=None,
+               columns: Optional[Sequence[str]] = None) -> np.ndarray:
+        """Row-major float32 feature matrix for the given rows (slice or indices)"""
+        names = list(columns) if columns is not None else settings.FEATURE_NAMES
+        rows = slice(None) if rows is None else rows
+
+        first = self.column(names[0])[rows]
+        out = np.empty((len(first), len(names)), dtype=np.float32)
+        out[:, 0] = first
+        for j, name in enumerate(names[1:], start=1):
+            out[:, j] = self.column(name)[rows]
+        return out
+
+    def sample(self, n: int, seed: int = 0) -> np.ndarray:
+        """Random sample of rows as a float32 feature matrix"""
+        n = min(n, len(self))
+        rng = np.random.default_rng(seed)
+        rows = np.sort(rng.choice(len(self), size=n, replace=False))
+        return self.matrix(rows)
@@ -0,0 +1,63 @@
+"""
+Single-flight coalescing of identical in-flight calls
+"""
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """Run at most one call per key at a time; concurrent callers share its result"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._inflight: Dict[Hashable, Future] = {}
+        self.executed = 0
+        self.coalesced = 0
+        self.failed = 0
+
+    def do(self, key: Hashable, fn: Callable, *args, **kwargs) -> Any:
+        """Call fn(*args, **kwargs), or wait for an identical call already running"""
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[key] = future
+                self.executed += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            with self._lock:
+                self.failed += 1
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._inflight[key]
+
+    def reset_stats(self) -> None:
+        """Zero the counters (in-flight calls are unaffected)"""
+        with self._lock:
+            self.executed = 0
+            self.coalesced = 0
+            self.failed = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Counters since startup"""
+        with self._lock:
+            return {
+                "executed": self.executed,
+                "coalesced": self.coalesced,
+                "failed": self.failed,
+                "in_flight": len(self._inflight)
+            }
@@ -0,0 +1,89 @@
+"""
+What-if sensitivity sweeps and partial dependence, scored in one vectorized pass
+"""
+import numpy as np
+from typing import Dict, List, Sequence, Tuple
+from config import settings
+from features import feature_encoder
+from models import SweepAxis
+
+
+def build_axis(axis: SweepAxis, feature_ranges: Dict[str, Dict[str, float]]) -> Tuple[int, np.ndarray]:
+    """Resolve a sweep axis to (column index, float32 grid values)"""
+    if axis.feature not in feature_encoder.feature_names:
+        raise ValueError(f"Unknown feature {axis.feature}")
+    j = feature_encoder.feature_names.index(axis.feature)
+
+    is_integer = feature_encoder.integer_columns[j]
+
+    if axis.values is not None:
+        grid = np.asarray(axis.values, dtype=feature_encoder.DTYPE)
+        if is_integer and np.any(grid % 1 != 0):
+            raise ValueError(f"{axis.feature}: values must be whole numbers")
+    else:
+        observed = feature_ranges.get(axis.feature, {})
+        # Observed reference ranges can exceed the request schema, so clip them
+        low = axis.min if axis.min is not None else \
+            max(observed.get("min", feature_encoder.lower[j]), feature_encoder.lower[j])
+        high = axis.max if axis.max is not None else \
+            min(observed.get("max", feature_encoder.upper[j]), feature_encoder.upper[j])
+        points = axis.points or settings.SWEEP_DEFAULT_POINTS
+        grid = np.linspace(low, high, points, dtype=feature_encoder.DTYPE)
+        if is_integer:
+            grid = np.unique(np.round(grid))
+
+    if not np.all(np.isfinite(grid)) or grid.min() < feature_encoder.lower[j] \
+            or grid.max() > feature_encoder.upper[j]:
+        raise ValueError(
+            f"{axis.feature}: grid must lie within "
+            f"[{feature_encoder.lower[j]:g}, {feature_encoder.upper[j]:g}]")
+    return j, grid
+
+
+def build_axes(axes: Sequence[SweepAxis],
+               feature_ranges: Dict[str, Dict[str, float]]) -> List[Tuple[int, np.ndarray]]:
+    """Resolve all sweep axes, rejecting a feature that appears twice"""
+    features = [axis.feature for axis in axes]
+    if len(set(features)) != len(features):
+        raise ValueError("Each feature can only be swept once")
+    return [build_axis(axis, feature_ranges) for axis in axes]
+
+
+def build_grid(rows: np.ndarray, axes: Sequence[Tuple[int, np.ndarray]]) -> np.ndarray:
+    """Broadcast base rows against the grid into shape (*grid_shape, n_rows, n_features)"""
+    grid_shape = tuple(len(values) for _, values in axes)
+    out = np.empty(grid_shape + rows.shape, dtype=feature_encoder.DTYPE)
+    out[...] = rows
+
+    for k, (j, values) in enumerate(axes):
+        shape = [1] * len(grid_shape) + [1]
+        shape[k] = len(values)
+        out[..., j] = values.reshape(shape)
+    return out
+
+
+def score_grid(ml_service, model_name: str, rows: np.ndarray,
+               axes: Sequence[Tuple[int, np.ndarray]]) -> Tuple[np.ndarray, int]:
+    """Mean churn probability over rows at each grid point, and rows scored"""
+    grid_shape = tuple(len(values) for _, values in axes)
+    total = int(np.prod(grid_shape)) * len(rows)
+    if total > settings.SWEEP_MAX_ROWS:
+        raise ValueError(
+            f"Sweep would score {total} rows, limit is {settings.SWEEP_MAX_ROWS}")
+
+    matrix = build_grid(rows, axes).reshape(-1, rows.shape[1])
+    probabilities = ml_service.predict_proba_batch(model_name, matrix)
+    return probabilities.reshape(grid_shape + (len(rows),)).mean(axis=-1), total
+
+
+def sweep_response(model_name: str, axes_spec: List[SweepAxis],
+                   axes: Sequence[Tuple[int, np.ndarray]],
+                   surface: np.ndarray, rows_scored: int) -> Dict:
+    """Plain-JSON payload for SweepResponse"""
+    return {
+        "model_name": model_name,
+        "features": [axis.feature for axis in axes_spec],
+        "grid": [np.round(values.astype(float), 4).tolist() for _, values in axes],
+        "churn_probability": np.round(surface.astype(float), 4).tolist(),
+        "rows_scored": rows_scored
+    }
@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from batch_jobs import BatchJobStore
+from config import settings
+
+ROW = dict(price=10.0, freight_value=2.0, payment_installments=3,
+           delivery_diff_than_estimated=-4, reviewed_days=0,
+           customer_state_enc=0.8, product_category_name_enc=100,
+           payment_type_enc=1)
+
+
+class FakeService:
+    """Scores every row 0.75"""
+
+    def predict_proba_batch(self, model_name, features):
+        return np.full(len(features), 0.75)
+
+
+def _chunk(rows):
+    return pd.DataFrame(rows).to_csv(index=False).encode()
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "BATCH_JOB_DIR", str(tmp_path))
+    return BatchJobStore()
+
+
+def _results(job):
+    return pd.read_csv(job.results_path)
+
+
+def test_resent_chunk_is_not_appended_twice(store):
+    job = store.create(2)
+    store.add_chunk(job, FakeService(), "m", 0, _chunk([ROW]))
+    summary = store.add_chunk(job, FakeService(), "m", 0, _chunk([ROW]))
+
+    assert summary["rows_processed"] == 1
+    assert len(_results(job)) == 1
+
+    store.add_chunk(job, FakeService(), "m", 1, _chunk([ROW]))
+    assert len(_results(job)) == 2
+
+
+def test_chunk_gap_is_rejected(store):
+    job = store.create()
+    with pytest.raises(ValueError):
+        store.add_chunk(job, FakeService(), "m", 1, _chunk([ROW]))
+    assert job.rows_processed == 0
+
+
+def test_invalid_rows_are_flagged_not_scored(store):
+    job = store.create()
+    rows = [ROW, dict(ROW, price=-1.0), dict(ROW, payment_installments=2.5)]
+    summary = store.add_chunk(job, FakeService(), "m", 0, _chunk(rows))
+
+    assert summary["rows_invalid"] == 2
+    assert summary["predicted_churn"] == 1
+    results = _results(job)
+    assert results["valid"].tolist() == [True, False, False]
+    assert results["churn_probability"].isna().tolist() == [False, True, True]
+
+
+def test_missing_columns_are_rejected(store):
+    job = store.create()
+    with pytest.raises(ValueError):
+        store.add_chunk(job, FakeService(), "m", 0, b"a,b\n1,2\n")
+
+
+def test_completed_job_rejects_chunks(store):
+    job = store.create()
+    store.complete(job)
+    with pytest.raises(ValueError):
+        store.add_chunk(job, FakeService(), "m", 0, _chunk([ROW]))
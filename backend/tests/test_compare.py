@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from compare import ModelComparer
+from config import settings
+from models import CompareRequest
+
+RESULTS = {
+    "a": {"probabilities": np.array([0.2, 0.4])},
+    "b": {"probabilities": np.array([0.6, 0.8])},
+    "broken": {"error": "boom"},
+}
+
+
+def test_ensemble_normalizes_weights():
+    combined = ModelComparer.ensemble(RESULTS, {"a": 1.0, "b": 3.0})
+
+    assert combined["weights"] == pytest.approx({"a": 0.25, "b": 0.75})
+    np.testing.assert_allclose(combined["probabilities"], [0.5, 0.7])
+
+
+def test_ensemble_skips_errored_models():
+    combined = ModelComparer.ensemble(RESULTS, {"a": 1.0, "broken": 5.0})
+
+    assert set(combined["weights"]) == {"a"}
+    np.testing.assert_allclose(combined["probabilities"], [0.2, 0.4])
+
+
+def test_ensemble_ignores_zero_and_negative_weights():
+    combined = ModelComparer.ensemble(RESULTS, {"a": 0.0, "b": -1.0})
+    assert combined is None
+
+    combined = ModelComparer.ensemble(RESULTS, {"a": -2.0, "b": 2.0})
+    assert combined["weights"] == {"b": 1.0}
+
+
+def test_default_weights_use_test_roc_auc():
+    weights = ModelComparer.default_weights(["XGBoost", "Unknown"])
+
+    assert weights["XGBoost"] == settings.MODEL_PERFORMANCE["XGBoost"]["test"]["roc_auc"]
+    assert weights["Unknown"] == 1.0
+
+
+def test_record_count_is_limited_by_schema():
+    record = dict(price=10.0, freight_value=2.0, payment_installments=3,
+                  delivery_diff_than_estimated=-4, reviewed_days=0,
+                  customer_state_enc=0.8, product_category_name_enc=100,
+                  payment_type_enc=1)
+    with pytest.raises(ValidationError):
+        CompareRequest(records=[record] * (settings.COMPARE_MAX_ROWS + 1))
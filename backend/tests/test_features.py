@@ -0,0 +1,49 @@
+import numpy as np
+
+from features import feature_encoder
+from models import PredictionRequest
+
+BASE = dict(price=10.0, freight_value=2.0, payment_installments=3,
+            delivery_diff_than_estimated=-4, reviewed_days=0,
+            customer_state_enc=0.8, product_category_name_enc=100,
+            payment_type_enc=1)
+
+
+def test_encode_follows_schema_order_as_float32():
+    features = feature_encoder.encode(PredictionRequest(**BASE))
+
+    assert features.dtype == np.float32
+    assert features.shape == (1, feature_encoder.n_features)
+    expected = np.array([[BASE[name] for name in feature_encoder.feature_names]],
+                        dtype=np.float32)
+    np.testing.assert_array_equal(features, expected)
+
+
+def test_encode_many_accepts_requests_and_dicts():
+    records = [PredictionRequest(**BASE), dict(BASE, price=20.0)]
+    features = feature_encoder.encode_many(records)
+
+    assert features.shape == (2, feature_encoder.n_features)
+    assert features[1, feature_encoder.feature_names.index("price")] == 20.0
+
+
+def test_bounds_come_from_request_model():
+    j = feature_encoder.feature_names.index("delivery_diff_than_estimated")
+    assert feature_encoder.lower[j] == -50
+    assert feature_encoder.upper[j] == 200
+
+
+def test_invalid_rows_flags_out_of_bounds_and_non_finite():
+    matrix = feature_encoder.encode_many([BASE, BASE, BASE]).copy()
+    matrix[1, feature_encoder.feature_names.index("price")] = -1
+    matrix[2, feature_encoder.feature_names.index("freight_value")] = np.nan
+
+    np.testing.assert_array_equal(
+        feature_encoder.invalid_rows(matrix), [False, True, True])
+
+
+def test_invalid_rows_flags_fractional_int_fields():
+    matrix = feature_encoder.encode_many([BASE, BASE]).copy()
+    matrix[1, feature_encoder.feature_names.index("payment_installments")] = 2.5
+
+    np.testing.assert_array_equal(feature_encoder.invalid_rows(matrix), [False, True])
@@ -0,0 +1,126 @@
+import cProfile
+import marshal
+import pstats
+import time
+
+import pytest
+from fastapi import HTTPException
+
+import profiling
+from api import require_admin
+from config import settings
+from profiling import Profiler, is_admin
+
+
+def _busy():
+    return sum(i * i for i in range(1000))
+
+
+def _profile_of(func) -> cProfile.Profile:
+    profile = cProfile.Profile()
+    profile.enable()
+    func()
+    profile.disable()
+    return profile
+
+
+def test_should_profile_inactive_unless_forced():
+    profiler = Profiler()
+
+    assert not profiler.should_profile()
+    assert profiler.should_profile(forced=True)
+
+
+def test_should_profile_samples_while_active():
+    profiler = Profiler()
+    profiler.start(sample_rate=1.0)
+    assert profiler.should_profile()
+
+    profiler.start(sample_rate=0.0)
+    assert not profiler.should_profile()
+
+    profiler.stop()
+    assert not profiler.should_profile()
+
+
+def test_should_profile_deactivates_after_window():
+    profiler = Profiler()
+    profiler.start(sample_rate=1.0, duration_seconds=60)
+    profiler.until = time.time() - 1
+
+    assert not profiler.should_profile()
+    assert not profiler.active
+
+
+def test_record_aggregates_loadable_pstats(tmp_path):
+    profiler = Profiler()
+    assert profiler.dump_pstats() is None
+
+    profiler.record(_profile_of(_busy))
+    profiler.record(_profile_of(_busy))
+    assert profiler.status()["profiled_requests"] == 2
+
+    data = profiler.dump_pstats()
+    assert isinstance(marshal.loads(data), dict)
+
+    path = tmp_path / "churn.pstats"
+    path.write_bytes(data)
+    stats = pstats.Stats(str(path))
+    assert any(func[2] == "_busy" for func in stats.stats)
+
+    assert "_busy" in profiler.dump_text(sort_by="tottime", limit=10)
+
+    profiler.reset()
+    assert profiler.dump_pstats() is None
+    assert profiler.status()["profiled_requests"] == 0
+
+
+def test_is_admin(monkeypatch):
+    monkeypatch.setattr(settings, "PROFILING_ADMIN_TOKEN", "")
+    assert not is_admin("")
+    assert not is_admin(None)
+
+    monkeypatch.setattr(settings, "PROFILING_ADMIN_TOKEN", "s3cret")
+    assert is_admin("s3cret")
+    assert not is_admin("wrong")
+    assert not is_admin(None)
+
+
+def test_require_admin_rejects_bad_token(monkeypatch):
+    monkeypatch.setattr(settings, "PROFILING_ADMIN_TOKEN", "s3cret")
+    require_admin("s3cret")
+
+    with pytest.raises(HTTPException) as exc:
+        require_admin("wrong")
+    assert exc.value.status_code == 403
+
+
+@pytest.fixture
+def enabled_profiler(monkeypatch):
+    monkeypatch.setattr(settings, "PROFILING_ENABLED", True)
+    monkeypatch.setattr(settings, "PROFILING_ADMIN_TOKEN", "s3cret")
+    fresh = Profiler()
+    monkeypatch.setattr(profiling, "profiler", fresh)
+    return fresh
+
+
+def test_profiled_forced_by_header_with_admin_token(enabled_profiler):
+    endpoint = profiling.profiled(_busy)
+
+    assert endpoint(x_profile_header="1", x_profile_admin_token="wrong") == _busy()
+    assert enabled_profiler.profiled_requests == 0
+
+    endpoint(x_profile_header="1", x_profile_admin_token="s3cret")
+    assert enabled_profiler.profiled_requests == 1
+
+
+def test_profiled_runs_unprofiled_when_slot_busy(enabled_profiler):
+    enabled_profiler.start(sample_rate=1.0)
+    endpoint = profiling.profiled(_busy)
+
+    with profiling._profile_slot:
+        assert endpoint() == _busy()
+    assert enabled_profiler.profiled_requests == 0
+
+    endpoint()
+    assert enabled_profiler.profiled_requests == 1
@@ -0,0 +1,84 @@
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from config import settings
+from reference_store import ReferenceStore
+
+ROWS = [
+    [10, 55.0, 18.49, 1.0, 9.0, 0.0, 0.8254, 199, 0],
+    [11, 145.99, 34.18, 3.0, 8.0, 0.0, 0.8350, 2808, 1],
+    [12, 17.0, 15.1, 6.0, 16.0, 2.0, 0.8175, 4607, 1],
+]
+
+
+def _write_csv(path, rows=ROWS):
+    lines = ["," + ",".join(settings.FEATURE_NAMES)]
+    lines += [",".join(str(v) for v in row) for row in rows]
+    path.write_text("\n".join(lines) + "\n")
+
+
+@pytest.fixture
+def store(tmp_path):
+    csv_path = tmp_path / "x_test.csv"
+    _write_csv(csv_path)
+    store = ReferenceStore(str(csv_path), str(tmp_path / "cache"))
+    assert store.load()
+    return store
+
+
+def test_columns_use_compact_dtypes(store):
+    assert len(store) == 3
+    assert store.column("price").dtype == np.float32
+    assert store.column("payment_type_enc").dtype == np.int16
+    assert isinstance(store.column("price"), np.memmap)
+    np.testing.assert_array_equal(store.column("product_category_name_enc"), [199, 2808, 4607])
+
+
+def test_fresh_cache_is_not_stale(store):
+    assert not store._is_stale()
+
+
+def test_size_change_makes_cache_stale(store):
+    _write_csv(Path(store.csv_path), ROWS[:2])
+    assert store._is_stale()
+
+
+def test_mtime_change_makes_cache_stale(store):
+    stat = os.stat(store.csv_path)
+    os.utime(store.csv_path, (stat.st_atime, stat.st_mtime + 10))
+    assert store._is_stale()
+
+
+def test_dtype_change_makes_cache_stale(store, monkeypatch):
+    monkeypatch.setitem(settings.FEATURE_DTYPES, "price", "float64")
+    assert store._is_stale()
+
+
+def test_missing_column_file_makes_cache_stale(store):
+    os.remove(store._column_path("freight_value"))
+    assert store._is_stale()
+
+
+def test_cast_widens_values_that_do_not_fit_int16():
+    too_large = ReferenceStore._cast("product_category_name_enc", np.array([1.0, 40000.0]))
+    fractional = ReferenceStore._cast("payment_installments", np.array([1.0, 2.5]))
+    fits = ReferenceStore._cast("payment_type_enc", np.array([0.0, 3.0]))
+
+    assert too_large.dtype == np.float32
+    assert fractional.dtype == np.float32
+    assert fits.dtype == np.int16
+
+
+def test_unwritable_cache_dir_falls_back_to_memory(tmp_path):
+    csv_path = tmp_path / "x_test.csv"
+    _write_csv(csv_path)
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("")
+
+    store = ReferenceStore(str(csv_path), str(blocker / "cache"))
+    assert store.load()
+    assert len(store) == 3
+    assert store.matrix().shape == (3, len(settings.FEATURE_NAMES))
@@ -0,0 +1,97 @@
+import threading
+import time
+
+import pytest
+
+from singleflight import SingleFlight
+
+N = 8
+
+
+def _run_concurrently(flight, fn):
+    """Start N callers on the same key once fn is already running"""
+    results, errors = [], []
+
+    def call():
+        try:
+            results.append(flight.do("key", fn))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=call) for _ in range(N)]
+    threads[0].start()
+    return threads, results, errors
+
+
+def _wait_for_followers(flight, threads):
+    for thread in threads[1:]:
+        thread.start()
+    # Followers are counted before they block on the shared future
+    deadline = time.monotonic() + 5
+    while flight.stats()["coalesced"] < N - 1 and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+def test_concurrent_calls_run_once():
+    flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def fn():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return 42
+
+    threads, results, errors = _run_concurrently(flight, fn)
+    started.wait(5)
+    _wait_for_followers(flight, threads)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert calls == [1]
+    assert results == [42] * N
+    assert not errors
+    assert flight.stats() == {"executed": 1, "coalesced": N - 1,
+                              "failed": 0, "in_flight": 0}
+
+
+def test_exception_reaches_every_waiter():
+    flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+
+    def fn():
+        started.set()
+        release.wait(5)
+        raise ValueError("boom")
+
+    threads, results, errors = _run_concurrently(flight, fn)
+    started.wait(5)
+    _wait_for_followers(flight, threads)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert not results
+    assert len(errors) == N
+    assert all(isinstance(e, ValueError) for e in errors)
+    assert flight.stats()["failed"] == 1
+
+
+def test_key_is_released_after_call():
+    flight = SingleFlight()
+    assert flight.do("key", lambda: 1) == 1
+    assert flight.do("key", lambda: 2) == 2
+
+    with pytest.raises(RuntimeError):
+        flight.do("key", lambda: (_ for _ in ()).throw(RuntimeError()))
+    assert flight.stats()["in_flight"] == 0
+
+
+def test_reset_stats_zeroes_counters():
+    flight = SingleFlight()
+    flight.do("key", lambda: 1)
+    flight.reset_stats()
+
+    assert flight.stats() == {"executed": 0, "coalesced": 0, "failed": 0, "in_flight": 0}
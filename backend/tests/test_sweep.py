@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+import sweep
+from config import settings
+from features import feature_encoder
+from models import SweepAxis
+
+PRICE = feature_encoder.feature_names.index("price")
+FREIGHT = feature_encoder.feature_names.index("freight_value")
+
+
+class FakeService:
+    """Scores each row as price / 1000 so grid placement is easy to check"""
+
+    def predict_proba_batch(self, model_name, features):
+        return features[:, PRICE] / 1000
+
+
+def _rows(n):
+    return np.full((n, feature_encoder.n_features), 1, dtype=np.float32)
+
+
+def test_build_grid_broadcasts_two_axes():
+    axes = [(PRICE, np.array([10, 20, 30], dtype=np.float32)),
+            (FREIGHT, np.array([1, 2], dtype=np.float32))]
+    grid = sweep.build_grid(_rows(4), axes)
+
+    assert grid.shape == (3, 2, 4, feature_encoder.n_features)
+    np.testing.assert_array_equal(grid[:, 0, 0, PRICE], [10, 20, 30])
+    np.testing.assert_array_equal(grid[0, :, 0, FREIGHT], [1, 2])
+    untouched = feature_encoder.feature_names.index("reviewed_days")
+    assert (grid[..., untouched] == 1).all()
+
+
+def test_score_grid_averages_over_rows():
+    axes = [(PRICE, np.array([100, 200], dtype=np.float32))]
+    surface, rows_scored = sweep.score_grid(FakeService(), "m", _rows(5), axes)
+
+    np.testing.assert_allclose(surface, [0.1, 0.2])
+    assert rows_scored == 10
+
+
+def test_integer_features_get_integer_grid():
+    _, grid = sweep.build_axis(
+        SweepAxis(feature="reviewed_days", min=0, max=10, points=4), {})
+    np.testing.assert_array_equal(grid, np.round(grid))
+
+
+def test_fractional_values_for_integer_feature_are_rejected():
+    with pytest.raises(ValueError):
+        sweep.build_axis(SweepAxis(feature="payment_type_enc", values=[0.5, 1.5]), {})
+
+    _, grid = sweep.build_axis(SweepAxis(feature="payment_type_enc", values=[0, 1]), {})
+    np.testing.assert_array_equal(grid, [0, 1])
+
+
+def test_grid_outside_schema_is_rejected():
+    with pytest.raises(ValueError):
+        sweep.build_axis(SweepAxis(feature="price", values=[-1.0]), {})
+
+
+def test_duplicate_features_are_rejected():
+    axes = [SweepAxis(feature="price"), SweepAxis(feature="price")]
+    with pytest.raises(ValueError):
+        sweep.build_axes(axes, {})
+
+
+def test_points_are_bounded_by_schema():
+    with pytest.raises(ValidationError):
+        SweepAxis(feature="price", points=settings.SWEEP_MAX_POINTS + 1)
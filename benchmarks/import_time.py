@@ -0,0 +1,89 @@
+"""
+Import-time budget check for each entry point.
+
+Runs `python -X importtime -c "import <module>"` in a fresh interpreter,
+reads the cumulative time of the entry module and fails if it is over
+budget or if a heavy dependency was pulled in eagerly.
+
+Usage: python benchmarks/import_time.py [--repeat N] [--scale FACTOR]
+"""
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# entry point -> (working dir, budget in ms, modules that must not be imported)
+BUDGETS: Dict[str, Tuple[str, float, List[str]]] = {
+    "ml_service": ("backend", 50, ["numpy", "pandas", "joblib", "sklearn", "xgboost"]),
+    "main": ("backend", 1500, ["pandas", "joblib", "sklearn", "xgboost"]),
+    "api_client": ("frontend", 2000, ["matplotlib", "seaborn"]),
+    "streamlit_app": ("frontend", 3000, ["matplotlib", "seaborn"]),
+}
+
+
+def measure(module: str, cwd: str) -> Tuple[float, List[str]]:
+    """Cumulative import time in ms and the list of top-level modules imported"""
+    code = f"import sys, {module}; print(' '.join(sorted(sys.modules)))"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=os.path.join(ROOT, cwd), capture_output=True, text=True)
+
+    if result.returncode != 0:
+        lines = result.stderr.strip().splitlines()
+        raise RuntimeError(lines[-1] if lines else f"exit code {result.returncode}")
+
+    cumulative_us = None
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = [p.strip() for p in line[len("import time:"):].split("|")]
+        if parts[2] == module:
+            cumulative_us = int(parts[1])
+
+    if cumulative_us is None:
+        raise RuntimeError(f"{module} missing from -X importtime output")
+
+    modules = result.stdout.split()
+    return cumulative_us / 1000, modules
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="runs per entry point, the best one is kept")
+    parser.add_argument("--scale", type=float, default=1.0,
+                        help="multiply every budget, e.g. for slow CI machines")
+    parser.add_argument("entry_points", nargs="*", default=list(BUDGETS))
+    args = parser.parse_args()
+
+    failures = 0
+    for module in args.entry_points:
+        cwd, budget_ms, forbidden = BUDGETS[module]
+        budget_ms *= args.scale
+
+        try:
+            runs = [measure(module, cwd) for _ in range(args.repeat)]
+        except RuntimeError as e:
+            print(f"⚠️  {module}: could not import ({e})")
+            failures += 1
+            continue
+
+        best_ms = min(ms for ms, _ in runs)
+        loaded = set(runs[0][1])
+        eager = [name for name in forbidden if name in loaded]
+
+        ok = best_ms <= budget_ms and not eager
+        status = "✅" if ok else "❌"
+        print(f"{status} {module}: {best_ms:.1f} ms (budget {budget_ms:.0f} ms)")
+        if eager:
+            print(f"   eagerly imports: {', '.join(eager)}")
+        failures += not ok
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,15 +1,91 @@
 import streamlit as st
 import requests
-from typing import Dict, List, Optional
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from typing import Any, BinaryIO, Callable, Dict, List, Optional
+from urllib3.util.retry import Retry
 from config import config
 
+
+def _pooled_adapter(retry_methods: frozenset) -> HTTPAdapter:
+    """Connection-pooling adapter that retries only the given HTTP methods"""
+    retry = Retry(
+        total=config.RETRY_TOTAL,
+        backoff_factor=config.RETRY_BACKOFF,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=retry_methods,
+        raise_on_status=False
+    )
+    return HTTPAdapter(
+        pool_connections=config.POOL_SIZE,
+        pool_maxsize=config.POOL_SIZE,
+        max_retries=retry
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def get_session() -> requests.Session:
+    """Shared keep-alive session with connection pooling and retry/backoff.
+
+    Only GETs are retried by default. POSTs are retried only for the
+    side-effect-free scoring routes in config.IDEMPOTENT_POST_PATHS, which
+    requests matches by longest URL prefix.
+    """
+    session = requests.Session()
+    default = _pooled_adapter(frozenset({"GET"}))
+    session.mount("http://", default)
+    session.mount("https://", default)
+
+    idempotent = _pooled_adapter(frozenset({"GET", "POST"}))
+    for path in config.IDEMPOTENT_POST_PATHS:
+        session.mount(f"{config.API_BASE_URL}{path}", idempotent)
+    return session
+
+
+@st.cache_resource(show_spinner=False)
+def get_executor() -> ThreadPoolExecutor:
+    """Shared thread pool for concurrent page data loads"""
+    return ThreadPoolExecutor(
+        max_workers=config.FETCH_WORKERS, thread_name_prefix="api-fetch")
+
+
+@st.cache_resource(show_spinner=False)
+def get_upload_executor() -> ThreadPoolExecutor:
+    """Separate pool for long-running bulk uploads, so they never starve page loads"""
+    return ThreadPoolExecutor(
+        max_workers=config.UPLOAD_WORKERS, thread_name_prefix="api-upload")
+
+
+def fetch_all(calls: Dict[str, Callable[[], Any]]) -> Dict[str, Any]:
+    """Run independent API calls in parallel and return their results by key.
+
+    Page render time is bounded by the slowest call instead of their sum.
+    """
+    try:
+        from streamlit.runtime.scriptrunner import (
+            add_script_run_ctx, get_script_run_ctx)
+        ctx = get_script_run_ctx()
+    except ImportError:
+        ctx = None
+
+    def run(fn: Callable[[], Any]) -> Any:
+        if ctx is not None:
+            add_script_run_ctx(ctx=ctx)
+        return fn()
+
+    executor = get_executor()
+    futures = {key: executor.submit(run, fn) for key, fn in calls.items()}
+    return {key: future.result() for key, future in futures.items()}
+
+
 # Standalone cached functions
 
 @st.cache_data(ttl=config.API_CACHE_TTL, show_spinner=False)
 def check_health() -> bool:
     """Check if API is running"""
     try:
-        response = requests.get(
+        response = get_session().get(
             f"{config.API_BASE_URL}/health",
             timeout=config.HEALTH_CHECK_TIMEOUT
         )
@@ -22,7 +98,7 @@ def check_health() -> bool:
 def get_models() -> List[str]:
     """Get available models"""
     try:
-        response = requests.get(
+        response = get_session().get(
             f"{config.API_BASE_URL}/models",
             timeout=config.HEALTH_CHECK_TIMEOUT
         )
@@ -37,7 +113,7 @@ def get_models() -> List[str]:
 def get_feature_ranges() -> Optional[Dict]:
     """Get feature ranges for sliders"""
     try:
-        response = requests.get(
+        response = get_session().get(
             f"{config.API_BASE_URL}/feature-ranges",
             timeout=config.HEALTH_CHECK_TIMEOUT
         )
@@ -51,7 +127,7 @@ def get_feature_ranges() -> Optional[Dict]:
 def predict(model_name: str, features: Dict) -> Optional[Dict]:
     """Make prediction"""
     try:
-        response = requests.post(
+        response = get_session().post(
             f"{config.API_BASE_URL}/predict/{model_name}",
             json=features,
             timeout=config.REQUEST_TIMEOUT
@@ -73,7 +149,7 @@ def predict(model_name: str, features: Dict) -> Optional[Dict]:
 def get_feature_importance(model_name: str) -> Optional[Dict]:
     """Get feature importance"""
     try:
-        response = requests.get(
+        response = get_session().get(
             f"{config.API_BASE_URL}/feature-importance/{model_name}",
             timeout=config.REQUEST_TIMEOUT
         )
@@ -88,7 +164,7 @@ def get_feature_importance(model_name: str) -> Optional[Dict]:
 def get_model_performance() -> Optional[Dict]:
     """Get model performance metrics from API"""
     try:
-        response = requests.get(
+        response = get_session().get(
             f"{config.API_BASE_URL}/model-performance",
             timeout=config.REQUEST_TIMEOUT
         )
@@ -97,3 +173,110 @@ def get_model_performance() -> Optional[Dict]:
         return None
     except:
         return None
+
+
+def _post_json(path: str, payload: Dict) -> Optional[Dict]:
+    """POST a JSON payload and return the response body, showing errors in the UI"""
+    try:
+        response = get_session().post(
+            f"{config.API_BASE_URL}{path}",
+            json=payload,
+            timeout=config.REQUEST_TIMEOUT
+        )
+        if response.status_code == 200:
+            return response.json()
+        detail = response.json().get("detail", "Request failed")
+        st.error(f"Request failed: {detail}")
+        return None
+    except requests.exceptions.Timeout:
+        st.error("Request timed out. Please try again.")
+        return None
+    except Exception:
+        st.error("Connection error. Please check if the API is running.")
+        return None
+
+
+def sweep(model_name: str, base: Dict, axes: List[Dict]) -> Optional[Dict]:
+    """What-if sweep of one or two features around a base customer"""
+    return _post_json(f"/sweep/{model_name}", {"base": base, "axes": axes})
+
+
+@st.cache_data(ttl=config.FEATURE_CACHE_TTL, show_spinner=False)
+def partial_dependence(model_name: str, feature: str, points: int,
+                       sample_size: int) -> Optional[Dict]:
+    """Population partial dependence for one feature over x_test.csv"""
+    return _post_json(f"/partial-dependence/{model_name}", {
+        "axes": [{"feature": feature, "points": points}],
+        "sample_size": sample_size
+    })
+
+
+# Bulk scoring - these run in a worker thread, so they raise instead of calling st.error
+
+def create_batch_job(total_rows: Optional[int] = None) -> Dict:
+    """Start a bulk scoring job on the backend"""
+    response = get_session().post(
+        f"{config.API_BASE_URL}/batch/jobs",
+        params={"total_rows": total_rows} if total_rows is not None else None,
+        timeout=config.REQUEST_TIMEOUT
+    )
+    response.raise_for_status()
+    return response.json()
+
+
+def _raise_for_detail(response: requests.Response) -> None:
+    if response.status_code != 200:
+        try:
+            detail = response.json().get("detail", response.reason)
+        except ValueError:
+            detail = response.reason
+        raise RuntimeError(detail)
+
+
+def upload_csv_in_chunks(job_id: str, stream: BinaryIO, chunk_rows: int) -> Dict:
+    """Stream a CSV to a job in chunks of raw lines, then mark it complete.
+
+    Lines are forwarded as-is with the header repeated on each chunk, so the
+    file is never parsed or held as a DataFrame here. Chunks carry a sequence
+    number so the backend ignores any that arrive twice. Assumes no quoted
+    newlines, which holds for the numeric customer feature files.
+    """
+    header = stream.readline()
+    for seq in itertools.count():
+        lines = list(itertools.islice(stream, chunk_rows))
+        if not lines:
+            break
+        response = get_session().post(
+            f"{config.API_BASE_URL}/batch/jobs/{job_id}/chunks",
+            params={"seq": seq},
+            data=header + b"".join(lines),
+            headers={"Content-Type": "text/csv"},
+            timeout=config.BATCH_CHUNK_TIMEOUT
+        )
+        _raise_for_detail(response)
+
+    response = get_session().post(
+        f"{config.API_BASE_URL}/batch/jobs/{job_id}/complete",
+        timeout=config.REQUEST_TIMEOUT
+    )
+    _raise_for_detail(response)
+    return response.json()
+
+
+def get_batch_job(job_id: str) -> Optional[Dict]:
+    """Progress and score distribution of a bulk scoring job"""
+    try:
+        response = get_session().get(
+            f"{config.API_BASE_URL}/batch/jobs/{job_id}",
+            timeout=config.HEALTH_CHECK_TIMEOUT
+        )
+        if response.status_code == 200:
+            return response.json()
+        return None
+    except:
+        return None
+
+
+def batch_results_url(job_id: str) -> str:
+    """Browser-facing download link, so results never pass through Streamlit"""
+    return f"{config.PUBLIC_API_URL}/batch/jobs/{job_id}/results"
@@ -0,0 +1,215 @@
+"""
+Pre-rendered, cached charts for the Insights page.
+
+Each chart is rendered once per distinct input data and cached as PNG bytes,
+so Streamlit reruns reuse the image instead of re-plotting. The cache key is
+a hash of the underlying data, so charts are only rebuilt when the
+performance or importance data returned by the API changes.
+"""
+import hashlib
+import io
+import json
+import streamlit as st
+from typing import Dict, Tuple
+from config import config
+
+METRICS = ['roc_auc', 'accuracy', 'precision', 'recall']
+METRIC_NAMES = ['ROC-AUC', 'Accuracy', 'Precision', 'Recall']
+
+
+def data_hash(data) -> str:
+    """Stable hash of JSON-serializable chart input"""
+    payload = json.dumps(data, sort_keys=True, default=str).encode()
+    return hashlib.sha256(payload).hexdigest()
+
+
+def _plotting():
+    """Import plotting libraries on first use (Predictions page never plots)"""
+    from matplotlib.figure import Figure
+    import seaborn as sns
+
+    sns.set_style("whitegrid")
+    return Figure, sns
+
+
+def _to_png(fig) -> bytes:
+    """Serialize a figure to PNG bytes"""
+    fig.tight_layout()
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=config.CHART_DPI, facecolor="white")
+    return buf.getvalue()
+
+
+@st.cache_data(max_entries=config.CHART_CACHE_ENTRIES, show_spinner=False)
+def _feature_importance_png(key: str, _importance_data: Dict) -> bytes:
+    Figure, sns = _plotting()
+
+    features = list(_importance_data['feature_importance'].keys())
+    importance = list(_importance_data['feature_importance'].values())
+
+    fig = Figure(figsize=(10, 8))
+    ax = fig.subplots()
+
+    # Create horizontal bar chart
+    y_pos = range(len(features))
+    bars = ax.barh(y_pos, importance, color=sns.color_palette(
+        "viridis", len(features)))
+
+    # Formatting
+    ax.set_yticks(y_pos)
+    ax.set_yticklabels(features)
+    ax.set_xlabel('Importance Score', fontsize=12)
+    ax.set_ylabel('Features', fontsize=12)
+    ax.set_title(
+        'Feature Importance - XGBoost', fontsize=14, fontweight='bold')
+    ax.invert_yaxis()
+
+    # Add value labels on bars
+    for bar in bars:
+        width = bar.get_width()
+        ax.text(width, bar.get_y() + bar.get_height()/2,
+                f'{width:.4f}', ha='left', va='center', fontsize=9)
+
+    return _to_png(fig)
+
+
+@st.cache_data(max_entries=config.CHART_CACHE_ENTRIES, show_spinner=False)
+def _train_test_png(key: str, _models_data: Dict) -> bytes:
+    import numpy as np
+    Figure, sns = _plotting()
+
+    fig = Figure(figsize=(14, 10))
+    axes = fig.subplots(2, 2).flatten()
+    model_names = list(_models_data.keys())
+
+    for idx, (metric, name) in enumerate(zip(METRICS, METRIC_NAMES)):
+        ax = axes[idx]
+
+        train_scores = [_models_data[m]['train'][metric] for m in model_names]
+        test_scores = [_models_data[m]['test'][metric] for m in model_names]
+
+        x = np.arange(len(model_names))
+        width = 0.35
+
+        bars1 = ax.bar(x - width/2, train_scores, width,
+                       label='Training', color='skyblue', alpha=0.8)
+        bars2 = ax.bar(x + width/2, test_scores, width,
+                       label='Testing', color='coral', alpha=0.8)
+
+        ax.set_xlabel('Models', fontsize=11)
+        ax.set_ylabel(name, fontsize=11)
+        ax.set_title(f'{name} - Training vs Testing',
+                     fontsize=12, fontweight='bold')
+        ax.set_xticks(x)
+        ax.set_xticklabels(model_names, rotation=45, ha='right')
+        ax.legend()
+        ax.grid(axis='y', alpha=0.3)
+
+        # Add value labels on bars
+        for bar in list(bars1) + list(bars2):
+            height = bar.get_height()
+            ax.text(bar.get_x() + bar.get_width()/2., height,
+                    f'{height:.3f}', ha='center', va='bottom', fontsize=8)
+
+    return _to_png(fig)
+
+
+@st.cache_data(max_entries=config.CHART_CACHE_ENTRIES, show_spinner=False)
+def _overfitting_png(key: str, _models_data: Dict) -> bytes:
+    Figure, sns = _plotting()
+
+    fig = Figure(figsize=(10, 6))
+    ax = fig.subplots()
+
+    model_names = list(_models_data.keys())
+    overfit_scores = [_models_data[m]['train']['accuracy'] - _models_data[m]['test']['accuracy']
+                      for m in model_names]
+
+    colors = ['red' if score > 0.1 else 'orange' if score > 0.05 else 'green'
+              for score in overfit_scores]
+
+    bars = ax.barh(model_names, overfit_scores, color=colors, alpha=0.7)
+    ax.set_xlabel('Accuracy Gap (Train - Test)', fontsize=11)
+    ax.set_title('Overfitting Indicator', fontsize=12, fontweight='bold')
+    ax.axvline(0.05, color='orange', linestyle='--',
+               linewidth=1, label='Moderate Gap')
+    ax.axvline(0.1, color='red', linestyle='--',
+               linewidth=1, label='High Gap')
+    ax.legend()
+    ax.grid(axis='x', alpha=0.3)
+
+    for bar, score in zip(bars, overfit_scores):
+        ax.text(score, bar.get_y() + bar.get_height()/2,
+                f'{score:.4f}', ha='left', va='center', fontsize=10)
+
+    return _to_png(fig)
+
+
+@st.cache_data(max_entries=config.CHART_CACHE_ENTRIES, show_spinner=False)
+def _consistency_png(key: str, _models_data: Dict) -> bytes:
+    import numpy as np
+    Figure, sns = _plotting()
+
+    consistency_scores = {}
+    for model in _models_data:
+        test_metrics = [_models_data[model]['test'][m] for m in METRICS]
+        consistency_scores[model] = np.std(test_metrics)
+
+    fig = Figure(figsize=(10, 6))
+    ax = fig.subplots()
+
+    bars = ax.barh(list(consistency_scores.keys()), list(consistency_scores.values()),
+                   color=sns.color_palette("coolwarm", len(consistency_scores)))
+    ax.set_xlabel('Standard Deviation', fontsize=11)
+    ax.set_title('Model Consistency Score', fontsize=12, fontweight='bold')
+    ax.grid(axis='x', alpha=0.3)
+
+    for bar in bars:
+        width = bar.get_width()
+        ax.text(width, bar.get_y() + bar.get_height()/2,
+                f'{width:.4f}', ha='left', va='center', fontsize=10)
+
+    return _to_png(fig)
+
+
+@st.cache_data(max_entries=config.CHART_CACHE_ENTRIES, show_spinner=False)
+def _confusion_matrix_png(key: str, _models_data: Dict) -> bytes:
+    import numpy as np
+    Figure, sns = _plotting()
+
+    fig = Figure(figsize=(14, 12))
+    axes = fig.subplots(2, 2).flatten()
+
+    for idx, model in enumerate(list(_models_data.keys())[:len(axes)]):
+        ax = axes[idx]
+        cm = np.array(_models_data[model]['test']['confusion_matrix'])
+
+        # Plot confusion matrix using seaborn
+        sns.heatmap(cm, annot=True, fmt='d', cmap='Blues', ax=ax, cbar=True,
+                    xticklabels=['Not Churn', 'Churn'],
+                    yticklabels=['Not Churn', 'Churn'])
+
+        ax.set_title(f'{model}\nAccuracy: {_models_data[model]["test"]["accuracy"]:.4f}',
+                     fontsize=12, fontweight='bold')
+        ax.set_ylabel('True Label', fontsize=11)
+        ax.set_xlabel('Predicted Label', fontsize=11)
+
+    return _to_png(fig)
+
+
+# Public API - data in, cached PNG bytes out
+
+def feature_importance_chart(importance_data: Dict) -> bytes:
+    """Horizontal bar chart of feature importance"""
+    return _feature_importance_png(data_hash(importance_data), importance_data)
+
+
+def performance_charts(models_data: Dict) -> Tuple[bytes, bytes, bytes, bytes]:
+    """Train/test grid, overfitting, consistency and confusion matrix charts"""
+    key = data_hash(models_data)
+    return (
+        _train_test_png(key, models_data),
+        _overfitting_png(key, models_data),
+        _consistency_png(key, models_data),
+        _confusion_matrix_png(key, models_data)
+    )
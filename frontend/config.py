@@ -3,19 +3,40 @@ import os
 class FrontendConfig:
     # API Configuration
     API_BASE_URL = os.getenv("API_BASE_URL", "http://localhost:8000")
+    PUBLIC_API_URL = os.getenv("PUBLIC_API_URL", API_BASE_URL)
     
     # Cache Settings
     API_CACHE_TTL = 300
     FEATURE_CACHE_TTL = 600
+    CHART_CACHE_ENTRIES = 16
     
     # UI Settings
     PAGE_TITLE = "Customer Churn Prediction App"
     PAGE_ICON = "📊"
     LAYOUT = "wide"
     SIDEBAR_STATE = "collapsed"
+    CHART_DPI = 100
     
     # Request Settings
     REQUEST_TIMEOUT = 10
     HEALTH_CHECK_TIMEOUT = 3
 
+    # Connection Pool Settings
+    POOL_SIZE = 10
+    RETRY_TOTAL = 3
+    RETRY_BACKOFF = 0.3
+    FETCH_WORKERS = 4
+    # POST routes that are safe to retry (pure scoring, no server-side state)
+    IDEMPOTENT_POST_PATHS = ("/predict/", "/sweep/", "/partial-dependence/")
+
+    # What-if Sweep Settings
+    SWEEP_POINTS = 25
+    PDP_SAMPLE_SIZE = 200
+
+    # Bulk Scoring Settings
+    BATCH_CHUNK_ROWS = 2000
+    UPLOAD_WORKERS = 4
+    BATCH_CHUNK_TIMEOUT = 60
+    BATCH_POLL_INTERVAL = 0.5
+
 config = FrontendConfig()
\ No newline at end of file
@@ -1,14 +1,9 @@
 import streamlit as st
-import matplotlib.pyplot as plt
-import seaborn as sns
-import numpy as np
 from typing import Dict, List, Optional
 
 from config import config
 import api_client
-
-sns.set_style("whitegrid")
-plt.rcParams['figure.facecolor'] = 'white'
+import charts
 
 st.set_page_config(
     page_title=config.PAGE_TITLE,
@@ -90,19 +85,19 @@ def prediction_page():
                                     [0, 1, 2, 3],
                                     format_func=lambda x: {0: "Credit Card", 1: "Boleto", 2: "Voucher", 3: "Debit Card"}[x])
 
+    features = {
+        "price": price,
+        "freight_value": freight_value,
+        "payment_installments": payment_installments,
+        "delivery_diff_than_estimated": delivery_diff,
+        "reviewed_days": reviewed_days,
+        "customer_state_enc": customer_state,
+        "product_category_name_enc": product_category,
+        "payment_type_enc": payment_type
+    }
+
     # Make prediction
     if st.button("🔮 Predict Churn", type="primary"):
-        features = {
-            "price": price,
-            "freight_value": freight_value,
-            "payment_installments": payment_installments,
-            "delivery_diff_than_estimated": delivery_diff,
-            "reviewed_days": reviewed_days,
-            "customer_state_enc": customer_state,
-            "product_category_name_enc": product_category,
-            "payment_type_enc": payment_type
-        }
-
         with st.spinner("Making prediction..."):
             result = api_client.predict("XGBoost", features)
 
@@ -125,52 +120,148 @@ def prediction_page():
 
             with col2:
                 st.metric("Confidence", result['confidence'])
-            
 
-def insights_page():
-    """Model insights and analytics page"""
-    st.title("📈 Model Insights & Analytics")
+    sensitivity_section(features)
+
+
+def sensitivity_section(features: Dict):
+    """What-if sweep of one feature around the current customer"""
+    st.markdown("---")
+    st.subheader("📉 What-if Sensitivity")
+    st.write("How churn probability changes as one feature varies while the others stay fixed.")
+
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        feature = st.selectbox("Feature to vary", [
+            "delivery_diff_than_estimated", "freight_value", "price",
+            "reviewed_days", "payment_installments"])
+    with col2:
+        show_population = st.checkbox("Compare with population average", value=True)
+
+    if not st.button("📈 Run Sweep"):
+        return
+
+    with st.spinner("Scoring sweep..."):
+        curve = api_client.sweep(
+            "XGBoost", features, [{"feature": feature, "points": config.SWEEP_POINTS}])
+        population = api_client.partial_dependence(
+            "XGBoost", feature, config.SWEEP_POINTS, config.PDP_SAMPLE_SIZE) \
+            if show_population else None
+
+    if not curve:
+        return
+
+    import pandas as pd
+
+    chart = pd.DataFrame(
+        {"This customer": curve["churn_probability"]},
+        index=pd.Index(curve["grid"][0], name=feature))
+    if population:
+        chart = chart.join(pd.Series(
+            population["churn_probability"],
+            index=pd.Index(population["grid"][0], name=feature),
+            name="Population average"), how="outer")
+
+    st.line_chart(chart)
+
+
+def bulk_page():
+    """Bulk CSV upload and scoring page"""
+    st.title("📂 Bulk Churn Scoring")
+    st.write("Upload a CSV with one customer per row and the same feature columns as the Predictions page.")
 
-    # Check API health
     if not api_client.check_health():
         st.error("🚨 Backend API is not running. Please start the FastAPI server.")
         return
 
-    # Get feature importance for XGBoost
-    importance_data = api_client.get_feature_importance("XGBoost")
+    uploaded = st.file_uploader("Customers CSV", type="csv")
+
+    if uploaded is not None and st.button("🚀 Score File", type="primary"):
+        total_rows = max(sum(1 for _ in uploaded) - 1, 0)
+        uploaded.seek(0)
+        try:
+            job = api_client.create_batch_job(total_rows)
+        except Exception:
+            st.error("Could not start the scoring job. Please try again.")
+            return
+
+        # Upload runs in a worker thread; this page only polls progress
+        st.session_state.bulk_job = {
+            "job_id": job["job_id"],
+            "future": api_client.get_upload_executor().submit(
+                api_client.upload_csv_in_chunks, job["job_id"], uploaded,
+                config.BATCH_CHUNK_ROWS)
+        }
 
-    if importance_data:
-        st.subheader("🎯 Feature Importance - XGBoost (Best Model)")
+    bulk_job = st.session_state.get("bulk_job")
+    if not bulk_job:
+        return
+
+    summary = api_client.get_batch_job(bulk_job["job_id"])
+    future = bulk_job["future"]
+
+    if summary:
+        total = summary["total_rows"] or 0
+        processed = summary["rows_processed"]
+        st.progress(min(processed / total, 1.0) if total else 0.0,
+                    text=f"{processed:,} / {total:,} rows processed")
+
+    if not future.done():
+        import time
+
+        time.sleep(config.BATCH_POLL_INTERVAL)
+        st.rerun()
+
+    if future.exception() is not None:
+        st.error(f"Scoring failed: {future.exception()}")
+        return
+
+    summary = future.result()
+    st.markdown("---")
+    st.subheader("🔍 Results")
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Rows Scored", f"{summary['rows_processed'] - summary['rows_invalid']:,}")
+    with col2:
+        st.metric("Predicted Churn", f"{summary['predicted_churn']:,}")
+    with col3:
+        mean = summary["mean_probability"]
+        st.metric("Mean Probability", f"{mean:.3f}" if mean is not None else "-")
+
+    if summary["rows_invalid"]:
+        st.warning(f"{summary['rows_invalid']:,} row(s) were missing values or out of range and were not scored.")
+
+    st.markdown("**Score Distribution**")
+    edges = summary["histogram"]["bin_edges"]
+    labels = [f"{low:.2f}-{high:.2f}" for low, high in zip(edges[:-1], edges[1:])]
+    st.bar_chart({"customers": dict(zip(labels, summary["histogram"]["counts"]))})
+
+    st.link_button("⬇️ Download Results CSV",
+                   api_client.batch_results_url(bulk_job["job_id"]))
 
-        # Feature importance chart using seaborn
-        features = list(importance_data['feature_importance'].keys())
-        importance = list(importance_data['feature_importance'].values())
 
-        fig, ax = plt.subplots(figsize=(10, 8))
+def insights_page():
+    """Model insights and analytics page"""
+    st.title("📈 Model Insights & Analytics")
 
-        # Create horizontal bar chart
-        y_pos = range(len(features))
-        bars = ax.barh(y_pos, importance, color=sns.color_palette(
-            "viridis", len(features)))
+    # Load health, feature importance and performance data in parallel
+    page_data = api_client.fetch_all({
+        "healthy": api_client.check_health,
+        "importance": lambda: api_client.get_feature_importance("XGBoost"),
+        "performance": api_client.get_model_performance
+    })
 
-        # Formatting
-        ax.set_yticks(y_pos)
-        ax.set_yticklabels(features)
-        ax.set_xlabel('Importance Score', fontsize=12)
-        ax.set_ylabel('Features', fontsize=12)
-        ax.set_title(
-            'Feature Importance - XGBoost', fontsize=14, fontweight='bold')
-        ax.invert_yaxis()
+    # Check API health
+    if not page_data["healthy"]:
+        st.error("🚨 Backend API is not running. Please start the FastAPI server.")
+        return
 
-        # Add value labels on bars
-        for i, bar in enumerate(bars):
-            width = bar.get_width()
-            ax.text(width, bar.get_y() + bar.get_height()/2,
-                    f'{width:.4f}', ha='left', va='center', fontsize=9)
+    importance_data = page_data["importance"]
 
-        plt.tight_layout()
-        st.pyplot(fig)
-        plt.close()
+    if importance_data:
+        st.subheader("🎯 Feature Importance - XGBoost (Best Model)")
+        st.image(charts.feature_importance_chart(importance_data))
 
         # Top features
         st.subheader("🏆 Top 5 Most Important Features")
@@ -189,59 +280,18 @@ def insights_page():
     st.subheader("📊 Model Performance Comparison")
     st.write("Comparing all models on both Training and Testing datasets to understand bias-variance tradeoff")
 
-    # Fetch model performance data from API
-    models_data = api_client.get_model_performance()
+    models_data = page_data["performance"]
 
     if not models_data:
         st.error("Failed to load model performance data from backend.")
         return
 
+    train_test_png, overfitting_png, consistency_png, confusion_png = \
+        charts.performance_charts(models_data)
+
     # 1. Metrics Comparison - Training vs Testing
     st.subheader("📈 Training vs Testing Performance")
-
-    metrics = ['roc_auc', 'accuracy', 'precision', 'recall']
-    metric_names = ['ROC-AUC', 'Accuracy', 'Precision', 'Recall']
-
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
-    axes = axes.flatten()
-
-    for idx, (metric, name) in enumerate(zip(metrics, metric_names)):
-        ax = axes[idx]
-
-        model_names = list(models_data.keys())
-        train_scores = [models_data[m]['train'][metric] for m in model_names]
-        test_scores = [models_data[m]['test'][metric] for m in model_names]
-
-        x = np.arange(len(model_names))
-        width = 0.35
-
-        bars1 = ax.bar(x - width/2, train_scores, width,
-                       label='Training', color='skyblue', alpha=0.8)
-        bars2 = ax.bar(x + width/2, test_scores, width,
-                       label='Testing', color='coral', alpha=0.8)
-
-        ax.set_xlabel('Models', fontsize=11)
-        ax.set_ylabel(name, fontsize=11)
-        ax.set_title(f'{name} - Training vs Testing',
-                     fontsize=12, fontweight='bold')
-        ax.set_xticks(x)
-        ax.set_xticklabels(model_names, rotation=45, ha='right')
-        ax.legend()
-        ax.grid(axis='y', alpha=0.3)
-
-        # Add value labels on bars
-        for bar in bars1:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{height:.3f}', ha='center', va='bottom', fontsize=8)
-        for bar in bars2:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{height:.3f}', ha='center', va='bottom', fontsize=8)
-
-    plt.tight_layout()
-    st.pyplot(fig)
-    plt.close()
+    st.image(train_test_png)
 
     # 2. Bias-Variance Analysis
     st.subheader("⚖️ Bias-Variance Tradeoff Analysis")
@@ -251,88 +301,21 @@ def insights_page():
     with col1:
         st.markdown("**🔍 Overfitting Detection**")
         st.write("Gap between Training and Testing Performance:")
-
-        fig, ax = plt.subplots(figsize=(10, 6))
-
-        model_names = list(models_data.keys())
-        overfit_scores = [models_data[m]['train']['accuracy'] - models_data[m]['test']['accuracy']
-                          for m in model_names]
-
-        colors = ['red' if score > 0.1 else 'orange' if score > 0.05 else 'green'
-                  for score in overfit_scores]
-
-        bars = ax.barh(model_names, overfit_scores, color=colors, alpha=0.7)
-        ax.set_xlabel('Accuracy Gap (Train - Test)', fontsize=11)
-        ax.set_title('Overfitting Indicator', fontsize=12, fontweight='bold')
-        ax.axvline(0.05, color='orange', linestyle='--',
-                   linewidth=1, label='Moderate Gap')
-        ax.axvline(0.1, color='red', linestyle='--',
-                   linewidth=1, label='High Gap')
-        ax.legend()
-        ax.grid(axis='x', alpha=0.3)
-
-        for i, (bar, score) in enumerate(zip(bars, overfit_scores)):
-            ax.text(score, bar.get_y() + bar.get_height()/2,
-                    f'{score:.4f}', ha='left', va='center', fontsize=10)
-
-        plt.tight_layout()
-        st.pyplot(fig)
-        plt.close()
+        st.image(overfitting_png)
 
         st.info("🟢 **Green**: Good generalization\n🟠 **Orange**: Moderate overfitting\n🔴 **Red**: High overfitting")
 
     with col2:
         st.markdown("**📊 Model Consistency**")
         st.write("Standard deviation across metrics (lower is better):")
-
-        consistency_scores = {}
-        for model in model_names:
-            test_metrics = [models_data[model]['test'][m] for m in metrics]
-            consistency_scores[model] = np.std(test_metrics)
-
-        fig, ax = plt.subplots(figsize=(10, 6))
-
-        bars = ax.barh(list(consistency_scores.keys()), list(consistency_scores.values()),
-                       color=sns.color_palette("coolwarm", len(consistency_scores)))
-        ax.set_xlabel('Standard Deviation', fontsize=11)
-        ax.set_title('Model Consistency Score', fontsize=12, fontweight='bold')
-        ax.grid(axis='x', alpha=0.3)
-
-        for bar in bars:
-            width = bar.get_width()
-            ax.text(width, bar.get_y() + bar.get_height()/2,
-                    f'{width:.4f}', ha='left', va='center', fontsize=10)
-
-        plt.tight_layout()
-        st.pyplot(fig)
-        plt.close()
+        st.image(consistency_png)
 
         st.info(
             "Lower standard deviation indicates more balanced performance across all metrics.")
 
     # 3. Confusion Matrix Comparison
     st.subheader("🔢 Confusion Matrix Comparison (Testing Set)")
-
-    fig, axes = plt.subplots(2, 2, figsize=(14, 12))
-    axes = axes.flatten()
-
-    for idx, model in enumerate(model_names):
-        ax = axes[idx]
-        cm = np.array(models_data[model]['test']['confusion_matrix'])
-
-        # Plot confusion matrix using seaborn
-        sns.heatmap(cm, annot=True, fmt='d', cmap='Blues', ax=ax, cbar=True,
-                    xticklabels=['Not Churn', 'Churn'],
-                    yticklabels=['Not Churn', 'Churn'])
-
-        ax.set_title(f'{model}\nAccuracy: {models_data[model]["test"]["accuracy"]:.4f}',
-                     fontsize=12, fontweight='bold')
-        ax.set_ylabel('True Label', fontsize=11)
-        ax.set_xlabel('Predicted Label', fontsize=11)
-
-    plt.tight_layout()
-    st.pyplot(fig)
-    plt.close()
+    st.image(confusion_png)
 
     # 4. Model Selection Recommendation
     st.subheader("🏆 Model Selection Recommendation")
@@ -367,12 +350,14 @@ def main():
     st.sidebar.title("🧭 Navigation")
     page = st.sidebar.radio(
         "Choose Page",
-        ["🔮 Predictions", "📈 Insights"],
+        ["🔮 Predictions", "📂 Bulk Scoring", "📈 Insights"],
         label_visibility="collapsed"
     )
 
     if page == "🔮 Predictions":
         prediction_page()
+    elif page == "📂 Bulk Scoring":
+        bulk_page()
     elif page == "📈 Insights":
         insights_page()
 